@@ -1,5 +1,7 @@
+import asyncio
 from typing import List, Optional
 
+from asynctradier.clients.account_urls import AccountURLs
 from asynctradier.common import EventType
 from asynctradier.common.account_balance import AccountBalance
 from asynctradier.common.event import Event
@@ -8,11 +10,20 @@ from asynctradier.common.order import Order
 from asynctradier.common.position import Position
 from asynctradier.common.user_profile import UserAccount
 from asynctradier.exceptions import APINotAvailable, InvalidDateFormat
-from asynctradier.utils.common import is_valid_expiration_date
+from asynctradier.utils.common import as_list, dig, is_valid_expiration_date, unwrap
 from asynctradier.utils.webutils import WebUtil
 
+# query string form of boolean parameters
+_BOOL_STR = {True: "true", False: "false"}
 
-class AccountClient:
+# number of orders requested per page by get_orders
+ORDERS_PAGE_SIZE = 25
+
+# number of order pages requested concurrently by get_orders
+ORDERS_PAGE_WINDOW = 4
+
+
+class AccountClient(AccountURLs):
     """
     A client for interacting with the Tradier Account API.
 
@@ -49,22 +60,15 @@ class AccountClient:
         if response.get("profile") is None:
             return []
 
-        if not isinstance(response["profile"]["account"], list):
-            accounts = [response["profile"]["account"]]
-        else:
-            accounts = response["profile"]["account"]
-
-        res: List[UserAccount] = []
-        for account in accounts:
-            res.append(
-                UserAccount(
-                    **account,
-                    id=response["profile"]["id"],
-                    name=response["profile"]["name"],
-                )
+        profile = response["profile"]
+        return [
+            UserAccount(
+                **account,
+                id=profile["id"],
+                name=profile["name"],
             )
-
-        return res
+            for account in as_list(profile["account"])
+        ]
 
     async def get_balance(self) -> AccountBalance:
         """
@@ -73,11 +77,8 @@ class AccountClient:
         Returns:
             AccountBalance: The account balance.
         """
-        url = f"/v1/accounts/{self.account_id}/balances"
-        response = await self.session.get(url)
-        return AccountBalance(
-            **response["balances"],
-        )
+        response = await self.session.get(self._balances_url)
+        return AccountBalance.from_dict(response["balances"])
 
     async def get_history(
         self,
@@ -124,12 +125,10 @@ class AccountClient:
         if exact_match is None:
             exact_match = False
 
-        url = f"/v1/accounts/{self.account_id}/history"
-
         params = {
             "page": page,
             "limit": limit,
-            "exactMatch": str(exact_match).lower(),
+            "exactMatch": _BOOL_STR[exact_match],
         }
 
         if event_type is not None:
@@ -144,29 +143,10 @@ class AccountClient:
         if symbol is not None:
             params["symbol"] = symbol
 
-        response = await self.session.get(url, params=params)
-
-        if response.get("history") is None:
-            return []
-
-        if response["history"].get("event") is None:
-            return []
-
-        if not isinstance(response["history"]["event"], list):
-            events = [response["history"]["event"]]
-        else:
-            events = response["history"]["event"]
+        response = await self.session.get(self._history_url, params=params)
 
-        results: List[Event] = []
-
-        for event in events:
-            results.append(
-                Event(
-                    **event,
-                )
-            )
-
-        return results
+        events = as_list(dig(response, "history", "event"))
+        return [Event.from_dict(event) for event in events]
 
     async def get_positions(self) -> List[Position]:
         """
@@ -175,22 +155,9 @@ class AccountClient:
         Returns:
             List[Position]: A list of Position objects.
         """
-        url = f"/v1/accounts/{self.account_id}/positions"
-        response = await self.session.get(url)
-        if response["positions"] == "null":
-            positions = []
-        else:
-            positions = response["positions"]["position"]
-        if not isinstance(positions, list):
-            positions = [positions]
-        results: List[Position] = []
-        for position in positions:
-            results.append(
-                Position(
-                    **position,
-                )
-            )
-        return results
+        response = await self.session.get(self._positions_url)
+        positions = as_list(dig(response, "positions", "position"))
+        return [Position.from_dict(position) for position in positions]
 
     async def get_gainloss(
         self,
@@ -234,8 +201,6 @@ class AccountClient:
         if limit is None or limit < 1:
             limit = 25
 
-        url = f"/v1/accounts/{self.account_id}/gainloss"
-
         params = {
             "page": page,
             "limit": limit,
@@ -252,49 +217,39 @@ class AccountClient:
         if symbol is not None:
             params["symbol"] = symbol
 
-        response = await self.session.get(url, params=params)
-
-        if response.get("gainloss") is None:
-            return []
-
-        if response["gainloss"].get("closed_position") is None:
-            return []
-
-        if not isinstance(response["gainloss"]["closed_position"], list):
-            positions = [response["gainloss"]["closed_position"]]
-        else:
-            positions = response["gainloss"]["closed_position"]
+        response = await self.session.get(self._gainloss_url, params=params)
 
-        results: List[ProfitLoss] = []
-
-        for position in positions:
-            results.append(
-                ProfitLoss(
-                    **position,
-                )
-            )
-
-        return results
+        positions = as_list(dig(response, "gainloss", "closed_position"))
+        return [ProfitLoss.from_dict(position) for position in positions]
 
     async def get_orders(self, page: int = 1) -> List[Order]:
         """
         Get a list of orders for the account.
 
+        Page 1 is requested on its own; only when it is full are the following
+        pages requested ORDERS_PAGE_WINDOW at a time, and another window is only
+        requested when the last page of the previous one was full. Results are
+        collected up to the first page that is not full.
+
         Parameters:
             page (int, optional): The page number of the orders to retrieve. Defaults to 1.
 
         Returns:
             List[Order]: A list of Order objects.
         """
-        res = []
-        page = 1
+        res = await self._get_orders(1)
+        if len(res) < ORDERS_PAGE_SIZE:
+            return res
+        page = 2
         while True:
-            orders = await self._get_orders(page)
-            res += orders
-            page += 1
-            if len(orders) <= 0:
-                break
-        return res
+            pages = await asyncio.gather(
+                *[self._get_orders(p) for p in range(page, page + ORDERS_PAGE_WINDOW)]
+            )
+            for orders in pages:
+                res.extend(orders)
+                if len(orders) < ORDERS_PAGE_SIZE:
+                    return res
+            page += ORDERS_PAGE_WINDOW
 
     async def _get_orders(self, page: int) -> List[Order]:
         """
@@ -306,27 +261,14 @@ class AccountClient:
         Returns:
             List[Order]: A list of Order objects.
         """
-        url = f"/v1/accounts/{self.account_id}/orders"
         params = {
             "page": page,
+            "limit": ORDERS_PAGE_SIZE,
             "includeTags": "true",
         }
-        response = await self.session.get(url, params=params)
-        if response["orders"] == "null":
-            orders = []
-        else:
-            orders = response["orders"]["order"]
-
-        if not isinstance(orders, list):
-            orders = [orders]
-        results: List[Order] = []
-        for order in orders:
-            results.append(
-                Order(
-                    **order,
-                )
-            )
-        return results
+        response = await self.session.get(self._orders_url, params=params)
+        orders = as_list(dig(response, "orders", "order"))
+        return [Order.from_dict(order) for order in orders]
 
     async def get_order(self, order_id: str) -> Order:
         """
@@ -338,10 +280,7 @@ class AccountClient:
         Returns:
             Order: The Order object.
         """
-        url = f"/v1/accounts/{self.account_id}/orders/{order_id}"
+        url = f"{self._orders_url}/{order_id}"
         params = {"includeTags": "true"}
         response = await self.session.get(url, params=params)
-        order = response["order"]
-        return Order(
-            **order,
-        )
+        return Order.from_dict(unwrap(response, "order"))
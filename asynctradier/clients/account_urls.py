@@ -0,0 +1,29 @@
+# account endpoint paths, relative to /v1/accounts/{account_id}
+_ACCOUNT_PATHS = {
+    "_balances_url": "/balances",
+    "_history_url": "/history",
+    "_positions_url": "/positions",
+    "_gainloss_url": "/gainloss",
+    "_orders_url": "/orders",
+}
+
+
+class AccountURLs:
+    """
+    Account endpoint paths shared by the clients that call them.
+
+    A path such as self._orders_url is built from account_id the first time it
+    is read and then stored as a plain instance attribute, so later reads are
+    ordinary attribute lookups. The paths are not set in __init__ because
+    TradierClient only runs the first client's __init__.
+    """
+
+    def __getattr__(self, name: str) -> str:
+        path = _ACCOUNT_PATHS.get(name)
+        if path is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        url = f"/v1/accounts/{self.account_id}{path}"
+        setattr(self, name, url)
+        return url
@@ -1,4 +1,7 @@
-from typing import List, Optional
+import asyncio
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from asynctradier.common import OptionType
 from asynctradier.common.calendar import Calendar
@@ -6,9 +9,48 @@ from asynctradier.common.expiration import Expiration
 from asynctradier.common.quote import Quote
 from asynctradier.common.security import Security
 from asynctradier.exceptions import InvalidExiprationDate, InvalidParameter
-from asynctradier.utils.common import is_valid_datetime, is_valid_expiration_date
+from asynctradier.utils.common import (
+    as_list,
+    dig,
+    is_valid_datetime,
+    is_valid_expiration_date,
+)
 from asynctradier.utils.webutils import WebUtil
 
+# query string form of boolean parameters
+_BOOL_STR = {True: "true", False: "false"}
+
+# valid calendar year and month parameters
+_YEAR_RE = re.compile(r"\A\d{4}\Z")
+_MONTHS = frozenset(f"{month:02d}" for month in range(1, 13))
+
+# maximum number of symbols sent in a single quotes request
+QUOTES_BATCH_SIZE = 100
+
+
+def _quotes_batch_params(
+    symbols: Sequence[str], greeks: bool
+) -> Tuple[Dict[str, str], ...]:
+    """
+    Build the query parameters of each quotes request for the given symbols.
+
+    Args:
+        symbols (Sequence[str]): The symbols to quote.
+        greeks (bool): Whether to include greeks in the response.
+
+    Returns:
+        Tuple[Dict[str, str], ...]: One parameter dict per batch of QUOTES_BATCH_SIZE symbols.
+    """
+    greeks_str = _BOOL_STR[greeks]
+    return tuple(
+        {"symbols": ",".join(symbols[i : i + QUOTES_BATCH_SIZE]), "greeks": greeks_str}
+        for i in range(0, len(symbols), QUOTES_BATCH_SIZE)
+    )
+
+
+# memoized variant used by get_quotes_many, keyed by the symbols tuple
+_cached_quotes_batch_params = lru_cache(maxsize=32)(_quotes_batch_params)
+
 
 class MarketDataClient:
     """
@@ -33,39 +75,93 @@ class MarketDataClient:
         """
         Get quotes for a list of symbols.
 
+        Symbols are requested in batches of QUOTES_BATCH_SIZE, concurrently.
+        Unmatched symbols are returned after all the matched quotes.
+
         Args:
             symbols (List[str]): A list of symbols.
             greeks (bool, optional): Whether to include greeks in the response. Defaults to False.
         """
-        url = "/v1/markets/quotes"
-        params = {"symbols": ",".join(symbols), "greeks": str(greeks).lower()}
+        return await self._get_quotes_batches(_quotes_batch_params(symbols, greeks))
+
+    async def get_quotes_many(
+        self, symbols: Tuple[str, ...], greeks: bool = False
+    ) -> Dict[str, Quote]:
+        """
+        Get quotes for a fixed set of symbols, keyed by symbol.
+
+        Meant for polling the same symbols repeatedly: the request parameters
+        for a given symbols tuple are built once and reused on later calls.
+
+        Args:
+            symbols (Tuple[str, ...]): The symbols to quote.
+            greeks (bool, optional): Whether to include greeks in the response. Defaults to False.
+
+        Returns:
+            Dict[str, Quote]: The quotes keyed by symbol, including unmatched symbols.
+        """
+        quotes = await self._get_quotes_batches(
+            _cached_quotes_batch_params(tuple(symbols), greeks)
+        )
+        return {quote.symbol: quote for quote in quotes}
+
+    async def _get_quotes_batches(
+        self, batch_params: Sequence[Dict[str, str]]
+    ) -> List[Quote]:
+        """
+        Request every batch of quotes concurrently and merge the results.
+
+        A single batch is awaited directly, without scheduling it as a task.
+
+        Args:
+            batch_params (Sequence[Dict[str, str]]): The query parameters of each batch.
+
+        Returns:
+            List[Quote]: The matched quotes followed by the unmatched symbols.
+        """
+        if len(batch_params) == 1:
+            quotes, unmatched = await self._get_quotes_batch(batch_params[0])
+            return quotes + unmatched
+
+        batches = await asyncio.gather(
+            *[self._get_quotes_batch(params) for params in batch_params]
+        )
+
+        results: List[Quote] = []
+        unmatched: List[Quote] = []
+        for quotes, unmatched_quotes in batches:
+            results += quotes
+            unmatched += unmatched_quotes
+        return results + unmatched
+
+    async def _get_quotes_batch(
+        self, params: Dict[str, str]
+    ) -> Tuple[List[Quote], List[Quote]]:
+        """
+        Get quotes for a single batch of symbols.
+
+        Args:
+            params (Dict[str, str]): The query parameters of the batch.
 
+        Returns:
+            Tuple[List[Quote], List[Quote]]: The matched quotes and the quotes for unmatched symbols.
+        """
+        url = "/v1/markets/quotes"
         response = await self.session.get(url, params=params)
 
-        quotes = response.get("quotes", {}).get("quote", [])
-        results = []
-        if not isinstance(quotes, list):
-            quotes = [quotes]
-        for quote in quotes:
-            results.append(
-                Quote(
-                    **quote,
-                )
-            )
-        unmatch_symbols = (
-            response.get("quotes", {}).get("unmatched_symbols", {}).get("symbol", [])
+        quotes = as_list(dig(response, "quotes", "quote"))
+        results = [Quote.from_dict(quote) for quote in quotes]
+        unmatch_symbols = as_list(
+            dig(response, "quotes", "unmatched_symbols", "symbol")
         )
-        if not isinstance(unmatch_symbols, list):
-            unmatch_symbols = [unmatch_symbols]
-
-        for symbol in unmatch_symbols:
-            results.append(
-                Quote(
-                    symbol=symbol,
-                    note="unmatched symbol",
-                )
+        unmatched = [
+            Quote(
+                symbol=symbol,
+                note="unmatched symbol",
             )
-        return results
+            for symbol in unmatch_symbols
+        ]
+        return results, unmatched
 
     async def get_option_chains(
         self,
@@ -90,26 +186,20 @@ class MarketDataClient:
         params = {
             "symbol": symbol,
             "expiration": expiration_date,
-            "greeks": str(greeks).lower(),
+            "greeks": _BOOL_STR[greeks],
         }
         response = await self.session.get(url, params=params)
 
-        # if no options or options is None, return empty list
-        if response.get("options") is None:
-            return []
-        results = []
-        chains = response.get("options", {}).get("option", [])
-        if not isinstance(chains, list):
-            chains = [chains]
-        for chain in chains:
-            if option_type is not None and chain["option_type"] != option_type.value:
-                continue
-            results.append(
-                Quote(
-                    **chain,
-                )
-            )
-        return results
+        chains = as_list(dig(response, "options", "option"))
+        if option_type is None:
+            return [Quote.from_dict(chain) for chain in chains]
+
+        option_type_value = option_type.value
+        return [
+            Quote.from_dict(chain)
+            for chain in chains
+            if chain["option_type"] == option_type_value
+        ]
 
     async def get_option_strikes(
         self, symbol: str, expiration_date: str
@@ -131,10 +221,7 @@ class MarketDataClient:
         }
         response = await self.session.get(url, params=params)
 
-        # if no strikes or strikes is None, return empty list
-        if response.get("strikes") is None:
-            return []
-        return response.get("strikes", {}).get("strike", [])
+        return dig(response, "strikes", "strike", default=[])
 
     async def get_option_expirations(
         self,
@@ -159,45 +246,19 @@ class MarketDataClient:
         url = "/v1/markets/options/expirations"
         params = {
             "symbol": symbol,
-            "strikes": str(strikes).lower(),
-            "contractSize": str(contract_size).lower(),
-            "expirationType": str(expiration_type).lower(),
+            "strikes": _BOOL_STR[strikes],
+            "contractSize": _BOOL_STR[contract_size],
+            "expirationType": _BOOL_STR[expiration_type],
         }
         response = await self.session.get(url, params=params)
 
-        results = []
+        if strikes or contract_size or expiration_type:
+            expirations = as_list(dig(response, "expirations", "expiration"))
 
-        if response.get("expirations") is None:
-            return results
+            return [Expiration.from_dict(expiration) for expiration in expirations]
 
-        if strikes or contract_size or expiration_type:
-            expirations = response.get("expirations", {}).get("expiration", [])
-
-            if not isinstance(expirations, list):
-                expirations = [expirations]
-
-            for expiration in expirations:
-                if expiration.get("strikes") is not None:
-                    expiration["strikes"] = expiration["strikes"]["strike"]
-                results.append(
-                    Expiration(
-                        **expiration,
-                    )
-                )
-        else:
-            expirations = response.get("expirations", {}).get("date", [])
-
-            if not isinstance(expirations, list):
-                expirations = [expirations]
-
-            for expiration in expirations:
-                results.append(
-                    Expiration(
-                        date=expiration,
-                    )
-                )
-
-        return results
+        expirations = as_list(dig(response, "expirations", "date"))
+        return [Expiration(date=expiration) for expiration in expirations]
 
     async def option_lookup(self, symbol: str) -> List[str]:
         """
@@ -212,9 +273,7 @@ class MarketDataClient:
         url = "/v1/markets/options/lookup"
         params = {"underlying": symbol}
         response = await self.session.get(url, params=params)
-        if response.get("symbols") is None:
-            return []
-        return response.get("symbols")[0].get("options", [])
+        return dig(response, "symbols", 0, "options", default=[])
 
     async def get_calendar(self, year: str, month: str) -> List[Calendar]:
         """
@@ -228,12 +287,12 @@ class MarketDataClient:
             List[Calendar]: A list of Calendar objects representing the calendar for the specified year and month.
         """
 
-        if len(year) != 4:
+        if _YEAR_RE.match(year) is None:
             raise InvalidParameter("year must be in the format YYYY")
         if len(month) != 2:
             raise InvalidParameter("month must be in the format MM")
 
-        if int(month) < 1 or int(month) > 12:
+        if month not in _MONTHS:
             raise InvalidParameter("month must be between 1 and 12")
 
         url = "/v1/markets/calendar"
@@ -241,20 +300,8 @@ class MarketDataClient:
 
         response = await self.session.get(url, params=params)
 
-        if response.get("calendar") is None:
-            return []
-        details = response["calendar"]["days"]["day"]
-
-        results: List[Calendar] = []
-
-        for detail in details:
-            results.append(
-                Calendar(
-                    **detail,
-                )
-            )
-
-        return results
+        details = as_list(dig(response, "calendar", "days", "day"))
+        return [Calendar.from_dict(detail) for detail in details]
 
     async def get_historical_quotes(
         self, symbol: str, interval: str, start: str, end: str
@@ -289,17 +336,8 @@ class MarketDataClient:
         }
         response = await self.session.get(url, params=params)
 
-        results = []
-        quotes = response.get("history", {}).get("day", [])
-        if not isinstance(quotes, list):
-            quotes = [quotes]
-        for quote in quotes:
-            results.append(
-                Quote(
-                    **quote,
-                )
-            )
-        return results
+        quotes = as_list(dig(response, "history", "day"))
+        return [Quote.from_dict(quote) for quote in quotes]
 
     async def get_time_and_sales(
         self,
@@ -356,20 +394,8 @@ class MarketDataClient:
 
         response = await self.session.get(url, params=params)
 
-        results = []
-        quotes = response.get("series", {}).get("data", [])
-
-        if not isinstance(quotes, list):
-            quotes = [quotes]
-
-        for quote in quotes:
-            results.append(
-                Quote(
-                    **quote,
-                )
-            )
-
-        return results
+        quotes = as_list(dig(response, "series", "data"))
+        return [Quote.from_dict(quote) for quote in quotes]
 
     async def get_etb_securities(self) -> List[Security]:
         """
@@ -381,21 +407,8 @@ class MarketDataClient:
         url = "/v1/markets/etb"
         response = await self.session.get(url)
 
-        if response.get("securities") is None:
-            return []
-
-        etbs = response.get("securities", {}).get("security", [])
-        results = []
-        if not isinstance(etbs, list):
-            etbs = [etbs]
-
-        for etb in etbs:
-            results.append(
-                Security(
-                    **etb,
-                )
-            )
-        return results
+        etbs = as_list(dig(response, "securities", "security"))
+        return [Security.from_dict(etb) for etb in etbs]
 
     async def search_companies(
         self, query: str, indexes: bool = False
@@ -411,24 +424,10 @@ class MarketDataClient:
             List[Security]: A list of Security objects representing the search results.
         """
         url = "/v1/markets/search"
-        params = {"q": query, "indexes": str(indexes).lower()}
+        params = {"q": query, "indexes": _BOOL_STR[indexes]}
         response = await self.session.get(url, params=params)
-        if response.get("securities") is None:
-            return []
-        results = []
-
-        securities = response.get("securities", {}).get("security", [])
-        if not isinstance(securities, list):
-            securities = [securities]
-
-        for security in securities:
-            results.append(
-                Security(
-                    **security,
-                )
-            )
-
-        return results
+        securities = as_list(dig(response, "securities", "security"))
+        return [Security.from_dict(security) for security in securities]
 
     async def lookup_symbol(
         self, query: str, exchanges: Optional[str] = None, types: Optional[str] = None
@@ -454,19 +453,5 @@ class MarketDataClient:
         if types:
             params["types"] = types
         response = await self.session.get(url, params=params)
-        if response.get("securities") is None:
-            return []
-        results = []
-
-        securities = response.get("securities", {}).get("security", [])
-        if not isinstance(securities, list):
-            securities = [securities]
-
-        for security in securities:
-            results.append(
-                Security(
-                    **security,
-                )
-            )
-
-        return results
+        securities = as_list(dig(response, "securities", "security"))
+        return [Security.from_dict(security) for security in securities]
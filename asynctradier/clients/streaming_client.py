@@ -1,15 +1,55 @@
-import json
-from typing import AsyncIterator, Dict, List
+import asyncio
+import time
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
 import websockets
+from websockets.exceptions import WebSocketException
 
+from asynctradier.clients.account_urls import AccountURLs
 from asynctradier.common import MarketDataType
 from asynctradier.common.market_data import MarketData
 from asynctradier.common.order import Order
+from asynctradier.utils.common import json_dumps, json_loads, unwrap
 from asynctradier.utils.webutils import WebUtil
 
+# maximum number of order events stream_order queues while their details load
+ORDER_DETAIL_WINDOW = 32
 
-class StreamingClient:
+# maximum number of order detail requests stream_order runs at the same time
+ORDER_DETAIL_WORKERS = 8
+
+# seconds a streaming session is reused before a new one is requested
+STREAM_SESSION_TTL = 240
+
+# websocket options shared by both streams. Tradier frames are small JSON
+# documents, so permessage-deflate costs CPU per frame for little bandwidth.
+_WS_OPTIONS = {
+    "compression": None,
+    "max_size": 2**20,
+    "ping_interval": 20,
+    "ping_timeout": 20,
+}
+
+# errors that mean the stream itself failed, so its session is dropped. Other
+# errors, such as a failed order detail request, leave the session cached.
+_STREAM_ERRORS = (WebSocketException, OSError)
+
+
+def _discard(future: asyncio.Future) -> None:
+    """
+    Cancel a future that is no longer awaited, retrieving its exception if it
+    already failed so asyncio does not report it as never retrieved.
+
+    Args:
+        future (asyncio.Future): The abandoned future.
+    """
+    if not future.done():
+        future.cancel()
+    elif not future.cancelled():
+        future.exception()
+
+
+class StreamingClient(AccountURLs):
     """
     A client for streaming market data and order events.
 
@@ -20,6 +60,11 @@ class StreamingClient:
         sandbox (bool, optional): Whether to use the sandbox environment. Defaults to False.
     """
 
+    # streaming sessions and the monotonic time they were created at. Declared
+    # on the class so clients built through TradierClient start empty as well.
+    _account_stream_session: Optional[Tuple[Dict[str, str], float]] = None
+    _market_stream_session: Optional[Tuple[Dict[str, str], float]] = None
+
     def __init__(
         self, session: WebUtil, account_id: str, token: str, sandbox: bool = False
     ) -> None:
@@ -38,40 +83,56 @@ class StreamingClient:
         Returns:
             Order: The Order object.
         """
-        url = f"/v1/accounts/{self.account_id}/orders/{order_id}"
+        url = f"{self._orders_url}/{order_id}"
         params = {"includeTags": "true"}
         response = await self.session.get(url, params=params)
-        order = response["order"]
-        return Order(
-            **order,
-        )
+        return Order.from_dict(unwrap(response, "order"))
 
     async def _get_streaming_account_session(self) -> Dict[str, str]:
         """
         Get the streaming account session.
 
+        A session is reused for STREAM_SESSION_TTL seconds.
+
         Returns:
             str: The streaming account session.
         """
+        cached = self._account_stream_session
+        if cached is not None and time.monotonic() - cached[1] < STREAM_SESSION_TTL:
+            return cached[0]
+
         url = "/v1/accounts/events/session"
         response = await self.session.post(url)
+        self._account_stream_session = (response, time.monotonic())
         return response
 
     async def _get_streaming_market_data_session(self) -> Dict[str, str]:
         """
         Get the streaming quote session.
 
+        A session is reused for STREAM_SESSION_TTL seconds.
+
         Returns:
             str: The streaming quote session.
         """
+        cached = self._market_stream_session
+        if cached is not None and time.monotonic() - cached[1] < STREAM_SESSION_TTL:
+            return cached[0]
+
         url = "/v1/markets/events/session"
         response = await self.session.post(url)
+        self._market_stream_session = (response, time.monotonic())
         return response
 
     async def stream_order(self, with_detail: bool = True) -> AsyncIterator[Order]:
         """
         Stream order events.
 
+        With with_detail, up to ORDER_DETAIL_WINDOW order events are queued
+        while the stream is read, and the details of at most
+        ORDER_DETAIL_WORKERS of them are requested at the same time. Orders are
+        still yielded in the order their events arrived.
+
         Args:
             with_detail (bool, optional): Whether to include order details. Defaults to True.
         """
@@ -79,26 +140,94 @@ class StreamingClient:
         uri = streaming_session["stream"]["url"]
         session_id = streaming_session["stream"]["sessionid"]
 
-        async with websockets.connect(uri) as websocket:
-            payload = {
-                "events": ["order"],
-                "sessionid": session_id,
-                "excludeAccounts": [],
-            }
-            payload = json.dumps(payload)
+        try:
+            async with websockets.connect(uri, **_WS_OPTIONS) as websocket:
+                payload = {
+                    "events": ["order"],
+                    "sessionid": session_id,
+                    "excludeAccounts": [],
+                }
+                payload = json_dumps(payload)
+
+                await websocket.send(payload)
 
-            await websocket.send(payload)
+                if not with_detail:
+                    while True:
+                        response = json_loads(await websocket.recv())
+                        if response["event"] == "order":
+                            yield Order.from_dict(response)
 
+                pending = asyncio.Queue(maxsize=ORDER_DETAIL_WINDOW)
+                producer = asyncio.ensure_future(
+                    self._queue_order_details(
+                        websocket, pending, asyncio.Semaphore(ORDER_DETAIL_WORKERS)
+                    )
+                )
+                try:
+                    while True:
+                        yield await (await pending.get())
+                finally:
+                    _discard(producer)
+                    while not pending.empty():
+                        _discard(pending.get_nowait())
+        except _STREAM_ERRORS:
+            # the session may be the reason the stream failed
+            self._account_stream_session = None
+            raise
+
+    async def _queue_order_details(
+        self,
+        websocket,
+        pending: "asyncio.Queue[asyncio.Future]",
+        workers: asyncio.Semaphore,
+    ) -> None:
+        """
+        Read order events from the websocket and start fetching their details.
+
+        A task fetching each order is put on the queue in the order the events
+        arrive, so details are requested concurrently while the stream keeps
+        being read. The queue size bounds how many events wait for details, and
+        the semaphore bounds how many requests are in flight. If reading the
+        websocket fails, a future holding the exception is queued so the
+        consumer raises it.
+
+        Args:
+            websocket: The connected account events websocket.
+            pending (asyncio.Queue[asyncio.Future]): The queue of order detail tasks.
+            workers (asyncio.Semaphore): Limits the concurrent detail requests.
+        """
+        try:
             while True:
-                response = json.loads(await websocket.recv())
-                if response["event"] == "heartbeat":
-                    continue
+                response = json_loads(await websocket.recv())
                 if response["event"] == "order":
-                    if with_detail:
-                        order_id = response["id"]
-                        yield await self.get_order(order_id)
-                    else:
-                        yield Order(**response)
+                    task = asyncio.ensure_future(
+                        self._get_order_detail(response["id"], workers)
+                    )
+                    try:
+                        await pending.put(task)
+                    except asyncio.CancelledError:
+                        task.cancel()
+                        raise
+        except Exception as exc:
+            failed = asyncio.get_running_loop().create_future()
+            failed.set_exception(exc)
+            await pending.put(failed)
+
+    async def _get_order_detail(
+        self, order_id: str, workers: asyncio.Semaphore
+    ) -> Order:
+        """
+        Get an order by its ID once one of the detail request slots is free.
+
+        Args:
+            order_id (str): The ID of the order.
+            workers (asyncio.Semaphore): Limits the concurrent detail requests.
+
+        Returns:
+            Order: The Order object.
+        """
+        async with workers:
+            return await self.get_order(order_id)
 
     async def stream_market_data(
         self,
@@ -131,19 +260,23 @@ class StreamingClient:
             filters = []
         filters.append(MarketDataType.trade)
 
-        async with websockets.connect(uri, ssl=True, compression=None) as websocket:
-            payload = {
-                "symbols": symbols,
-                "sessionid": session_id,
-                "linebreak": linebreak,
-                "filter": filters,
-                "validOnly": valid_only,
-                "advancedDetails": advanced_details,
-            }
-            payload = json.dumps(payload)
+        try:
+            async with websockets.connect(uri, ssl=True, **_WS_OPTIONS) as websocket:
+                payload = {
+                    "symbols": symbols,
+                    "sessionid": session_id,
+                    "linebreak": linebreak,
+                    "filter": filters,
+                    "validOnly": valid_only,
+                    "advancedDetails": advanced_details,
+                }
+                payload = json_dumps(payload)
 
-            await websocket.send(payload)
+                await websocket.send(payload)
 
-            while True:
-                response = json.loads(await websocket.recv())
-                yield MarketData(**response)
+                while True:
+                    yield MarketData.from_json(await websocket.recv())
+        except _STREAM_ERRORS:
+            # the session may be the reason the stream failed
+            self._market_stream_session = None
+            raise
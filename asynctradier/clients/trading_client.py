@@ -1,5 +1,6 @@
 from typing import List, Optional
 
+from asynctradier.clients.account_urls import AccountURLs
 from asynctradier.common import Duration, OptionType, OrderClass, OrderSide, OrderType
 from asynctradier.common.option_contract import OptionContract
 from asynctradier.common.order import Order
@@ -10,11 +11,23 @@ from asynctradier.exceptions import (
     InvalidStrikeType,
     MissingRequiredParameter,
 )
-from asynctradier.utils.common import build_option_symbol, is_valid_expiration_date
+from asynctradier.utils.common import (
+    build_option_symbol,
+    is_valid_expiration_date,
+    unwrap,
+)
 from asynctradier.utils.webutils import WebUtil
 
+# order class values sent with every order request
+_EQUITY = OrderClass.equity.value
+_OPTION = OrderClass.option.value
+_MULTILEG = OrderClass.multileg.value
+
+# multileg order types that require a net price
+_SPREAD_TYPES = frozenset((OrderType.debit, OrderType.credit))
+
 
-class TradingClient:
+class TradingClient(AccountURLs):
     """
     A client for trading operations.
 
@@ -136,31 +149,28 @@ class TradingClient:
             Order: The executed order.
         """
 
-        if order_type == OrderType.limit and price is None:
+        if order_type is OrderType.limit and price is None:
             raise MissingRequiredParameter("Price must be specified for limit orders")
 
-        if order_type == OrderType.stop and stop is None:
+        if order_type is OrderType.stop and stop is None:
             raise MissingRequiredParameter("Stop must be specified for stop orders")
 
-        url = f"/v1/accounts/{self.account_id}/orders"
+        url = self._orders_url
 
         params = {
-            "class": OrderClass.equity.value,
+            "class": _EQUITY,
             "symbol": symbol,
             "side": side.value,
             "quantity": str(quantity),
             "type": order_type.value,
             "duration": order_duration.value,
-            "price": str(price) if price is not None else "",
-            "stop": str(stop) if stop is not None else "",
+            "price": "" if price is None else str(price),
+            "stop": "" if stop is None else str(stop),
             "tag": tag,
         }
 
         response = await self.session.post(url, data=params)
-        order = response["order"]
-        return Order(
-            **order,
-        )
+        return Order.from_dict(unwrap(response, "order"))
 
     async def buy_option(
         self,
@@ -294,15 +304,15 @@ class TradingClient:
         if not isinstance(strike, float) and not isinstance(strike, int):
             raise InvalidStrikeType(strike)
 
-        if order_type == OrderType.limit and price is None:
+        if order_type is OrderType.limit and price is None:
             raise MissingRequiredParameter("Price must be specified for limit orders")
 
-        if order_type == OrderType.stop and stop is None:
+        if order_type is OrderType.stop and stop is None:
             raise MissingRequiredParameter("Stop must be specified for stop orders")
 
-        url = f"/v1/accounts/{self.account_id}/orders"
+        url = self._orders_url
         params = {
-            "class": OrderClass.option.value,
+            "class": _OPTION,
             "symbol": symbol,
             "option_symbol": build_option_symbol(
                 symbol, expiration_date, strike, option_type.value
@@ -311,15 +321,12 @@ class TradingClient:
             "quantity": str(quantity),
             "type": order_type.value,
             "duration": order_duration.value,
-            "price": price if price is not None else "",
-            "stop": stop if stop is not None else "",
+            "price": "" if price is None else str(price),
+            "stop": "" if stop is None else str(stop),
             "tag": tag,
         }
         response = await self.session.post(url, data=params)
-        order = response["order"]
-        return Order(
-            **order,
-        )
+        return Order.from_dict(unwrap(response, "order"))
 
     async def cancel_order(self, order_id: str | int) -> Order:
         """
@@ -331,12 +338,9 @@ class TradingClient:
         Returns:
             Order: The Order object.
         """
-        url = f"/v1/accounts/{self.account_id}/orders/{order_id}"
+        url = f"{self._orders_url}/{order_id}"
         response = await self.session.delete(url)
-        order = response["order"]
-        return Order(
-            **order,
-        )
+        return Order.from_dict(unwrap(response, "order"))
 
     async def modify_order(
         self,
@@ -359,24 +363,19 @@ class TradingClient:
         Returns:
             Order: The Order object.
         """
-        url = f"/v1/accounts/{self.account_id}/orders/{order_id}"
-        param = {}
-        if order_type is not None:
-            param["type"] = order_type.value
-        if order_duration is not None:
-            param["duration"] = order_duration.value
-        if price is not None:
-            param["price"] = price
-        if stop is not None:
-            param["stop"] = stop
-
-        if len(param) == 0:
+        url = f"{self._orders_url}/{order_id}"
+        candidates = (
+            ("type", None if order_type is None else order_type.value),
+            ("duration", None if order_duration is None else order_duration.value),
+            ("price", price),
+            ("stop", stop),
+        )
+        param = {key: value for key, value in candidates if value is not None}
+
+        if not param:
             raise InvalidParameter("No parameters to modify")
         response = await self.session.put(url, data=param)
-        order = response["order"]
-        return Order(
-            **order,
-        )
+        return Order.from_dict(unwrap(response, "order"))
 
     async def multileg(
         self,
@@ -403,27 +402,28 @@ class TradingClient:
             MissingRequiredParameter: If price is not specified for spread orders.
         """
 
-        url = f"/v1/accounts/{self.account_id}/orders"
+        url = self._orders_url
         body = {}
-        if order_type == OrderType.debit or order_type == OrderType.credit:
+        if order_type in _SPREAD_TYPES:
             if price is None:
                 raise MissingRequiredParameter(
                     "Price must be specified for spread orders"
                 )
             body["price"] = price
 
-        body["class"] = OrderClass.multileg.value
+        body["class"] = _MULTILEG
         body["symbol"] = symbol
         body["type"] = order_type.value
         body["duration"] = duration.value
-
-        for i, leg in enumerate(legs):
-            body[f"option_symbol[{i}]"] = leg.option_symbol
-            body[f"quantity[{i}]"] = str(leg.quantity)
-            body[f"side[{i}]"] = leg.order_side.value
+        body.update(
+            field
+            for i, leg in enumerate(legs)
+            for field in (
+                (f"option_symbol[{i}]", leg.option_symbol),
+                (f"quantity[{i}]", str(leg.quantity)),
+                (f"side[{i}]", leg.order_side.value),
+            )
+        )
 
         response = await self.session.post(url, data=body)
-        order = response["order"]
-        return Order(
-            **order,
-        )
+        return Order.from_dict(unwrap(response, "order"))
@@ -1,4 +1,54 @@
-from strenum import StrEnum
+from abc import ABC, abstractmethod
+from typing import Type, TypeVar
+
+try:
+    # the standard library StrEnum (3.11+) is implemented on the faster stdlib
+    # enum internals and needs no third-party package
+    from enum import StrEnum
+except ImportError:  # pragma: no cover
+    from strenum import StrEnum
+
+_Model = TypeVar("_Model", bound="ResponseModel")
+
+
+class ResponseModel(ABC):
+    """
+    Base class for models built from API response dictionaries.
+
+    Subclasses must implement _load, which reads their fields from the
+    response dictionary; a subclass without it cannot be instantiated. Models
+    can be built from keyword arguments, or with from_dict straight from a
+    decoded response without unpacking it into keyword arguments first.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, **kwargs) -> None:
+        self._load(kwargs)
+
+    @classmethod
+    def from_dict(cls: Type[_Model], data: dict) -> _Model:
+        """
+        Create a model object from an API response dictionary.
+
+        Args:
+            data (dict): The response dictionary.
+
+        Returns:
+            The model object.
+        """
+        obj = cls.__new__(cls)
+        obj._load(data)
+        return obj
+
+    @abstractmethod
+    def _load(self, data: dict) -> None:
+        """
+        Populate the model fields from an API response dictionary.
+
+        Args:
+            data (dict): The response dictionary.
+        """
 
 
 class OrderClass(StrEnum):
@@ -1,7 +1,10 @@
-from asynctradier.common import AccountType
+from asynctradier.common import AccountType, ResponseModel
+from asynctradier.utils.common import MemberLookup
 
+_ACCOUNT_TYPES = MemberLookup(AccountType)
 
-class CashAccountBalanceDetails:
+
+class CashAccountBalanceDetails(ResponseModel):
     """
     Represents the details of a cash account balance.
 
@@ -11,10 +14,16 @@ class CashAccountBalanceDetails:
         unsettled_funds (float): The amount of funds that are currently unsettled.
     """
 
-    def __init__(self, **kwargs):
-        self.cash_available = kwargs.get("cash_available", 0.0)
-        self.sweep = kwargs.get("sweep", 0.0)
-        self.unsettled_funds = kwargs.get("unsettled_funds", 0.0)
+    __slots__ = (
+        "cash_available",
+        "sweep",
+        "unsettled_funds",
+    )
+
+    def _load(self, data: dict) -> None:
+        self.cash_available = data.get("cash_available", 0.0)
+        self.sweep = data.get("sweep", 0.0)
+        self.unsettled_funds = data.get("unsettled_funds", 0.0)
 
     def to_dict(self):
         """
@@ -33,7 +42,7 @@ class CashAccountBalanceDetails:
         return f"CashAccountBalanceDetails(capacity={self.cash_available}, sweep={self.sweep}, unsettled_funds={self.unsettled_funds})"
 
 
-class MarginAccountBalanceDetails:
+class MarginAccountBalanceDetails(ResponseModel):
     """
     Represents the details of a margin account balance.
 
@@ -46,13 +55,22 @@ class MarginAccountBalanceDetails:
         sweep (float): The sweep amount.
     """
 
-    def __init__(self, **kwargs):
-        self.fed_call = kwargs.get("fed_call", 0.0)
-        self.maintenance_call = kwargs.get("maintenance_call", 0.0)
-        self.option_buying_power = kwargs.get("option_buying_power", 0.0)
-        self.stock_buying_power = kwargs.get("stock_buying_power", 0.0)
-        self.stock_short_value = kwargs.get("stock_short_value", 0.0)
-        self.sweep = kwargs.get("sweep", 0.0)
+    __slots__ = (
+        "fed_call",
+        "maintenance_call",
+        "option_buying_power",
+        "stock_buying_power",
+        "stock_short_value",
+        "sweep",
+    )
+
+    def _load(self, data: dict) -> None:
+        self.fed_call = data.get("fed_call", 0.0)
+        self.maintenance_call = data.get("maintenance_call", 0.0)
+        self.option_buying_power = data.get("option_buying_power", 0.0)
+        self.stock_buying_power = data.get("stock_buying_power", 0.0)
+        self.stock_short_value = data.get("stock_short_value", 0.0)
+        self.sweep = data.get("sweep", 0.0)
 
     def to_dict(self):
         """
@@ -74,7 +92,7 @@ class MarginAccountBalanceDetails:
         return f"MarginAccountBalanceDetails(fed_call={self.fed_call}, maintenance_call={self.maintenance_call}, option_buying_power={self.option_buying_power}, stock_buying_power={self.stock_buying_power}, stock_short_value={self.stock_short_value}, sweep={self.sweep})"
 
 
-class PDTAccountBalanceDetails:
+class PDTAccountBalanceDetails(ResponseModel):
     """
     Represents the account balance details for a Pattern Day Trader (PDT).
 
@@ -86,12 +104,20 @@ class PDTAccountBalanceDetails:
         stock_short_value (float): The value of shorted stocks.
     """
 
-    def __init__(self, **kwargs):
-        self.fed_call = kwargs.get("fed_call", 0.0)
-        self.maintenance_call = kwargs.get("maintenance_call", 0.0)
-        self.option_buying_power = kwargs.get("option_buying_power", 0.0)
-        self.stock_buying_power = kwargs.get("stock_buying_power", 0.0)
-        self.stock_short_value = kwargs.get("stock_short_value", 0.0)
+    __slots__ = (
+        "fed_call",
+        "maintenance_call",
+        "option_buying_power",
+        "stock_buying_power",
+        "stock_short_value",
+    )
+
+    def _load(self, data: dict) -> None:
+        self.fed_call = data.get("fed_call", 0.0)
+        self.maintenance_call = data.get("maintenance_call", 0.0)
+        self.option_buying_power = data.get("option_buying_power", 0.0)
+        self.stock_buying_power = data.get("stock_buying_power", 0.0)
+        self.stock_short_value = data.get("stock_short_value", 0.0)
 
     def to_dict(self):
         """
@@ -112,7 +138,7 @@ class PDTAccountBalanceDetails:
         return f"PDTAccountBalanceDetails(fed_call={self.fed_call}, maintenance_call={self.maintenance_call}, option_buying_power={self.option_buying_power}, stock_buying_power={self.stock_buying_power}, stock_short_value={self.stock_short_value})"
 
 
-class AccountBalance:
+class AccountBalance(ResponseModel):
     """
     Represents the balance of an account.
 
@@ -140,43 +166,56 @@ class AccountBalance:
         pdt (PDTAccountBalanceDetails): The details of the PDT account balance (if account type is pdt).
     """
 
-    def __init__(self, **kwargs):
-        self.option_short_value = kwargs.get("option_short_value")
-        self.total_equity = kwargs.get("total_equity")
-        self.account_number = kwargs.get("account_number")
-        self.account_type = (
-            AccountType(kwargs.get("account_type"))
-            if kwargs.get("account_type")
-            else None
-        )
-        self.close_pl = kwargs.get("close_pl")
-        self.current_requirement = kwargs.get("current_requirement")
-        self.equity = kwargs.get("equity")
-        self.long_market_value = kwargs.get("long_market_value")
-        self.market_value = kwargs.get("market_value")
-        self.open_pl = kwargs.get("open_pl")
-        self.option_long_value = kwargs.get("option_long_value")
-        self.option_requirement = kwargs.get("option_requirement")
-        self.pending_orders_count = kwargs.get("pending_orders_count")
-        self.short_market_value = kwargs.get("short_market_value")
-        self.stock_long_value = kwargs.get("stock_long_value")
-        self.total_cash = kwargs.get("total_cash")
-        self.uncleared_funds = kwargs.get("uncleared_funds")
-        self.pending_cash = kwargs.get("pending_cash")
-
-        self.cash = (
-            CashAccountBalanceDetails(**kwargs.get("cash"))
-            if kwargs.get("cash")
-            else None
-        )
-        self.margin = (
-            MarginAccountBalanceDetails(**kwargs.get("margin"))
-            if kwargs.get("margin")
-            else None
-        )
-        self.pdt = (
-            PDTAccountBalanceDetails(**kwargs.get("pdt")) if kwargs.get("pdt") else None
-        )
+    __slots__ = (
+        "option_short_value",
+        "total_equity",
+        "account_number",
+        "account_type",
+        "close_pl",
+        "current_requirement",
+        "equity",
+        "long_market_value",
+        "market_value",
+        "open_pl",
+        "option_long_value",
+        "option_requirement",
+        "pending_orders_count",
+        "short_market_value",
+        "stock_long_value",
+        "total_cash",
+        "uncleared_funds",
+        "pending_cash",
+        "cash",
+        "margin",
+        "pdt",
+    )
+
+    def _load(self, data: dict) -> None:
+        self.option_short_value = data.get("option_short_value")
+        self.total_equity = data.get("total_equity")
+        self.account_number = data.get("account_number")
+        self.account_type = _ACCOUNT_TYPES[data.get("account_type")]
+        self.close_pl = data.get("close_pl")
+        self.current_requirement = data.get("current_requirement")
+        self.equity = data.get("equity")
+        self.long_market_value = data.get("long_market_value")
+        self.market_value = data.get("market_value")
+        self.open_pl = data.get("open_pl")
+        self.option_long_value = data.get("option_long_value")
+        self.option_requirement = data.get("option_requirement")
+        self.pending_orders_count = data.get("pending_orders_count")
+        self.short_market_value = data.get("short_market_value")
+        self.stock_long_value = data.get("stock_long_value")
+        self.total_cash = data.get("total_cash")
+        self.uncleared_funds = data.get("uncleared_funds")
+        self.pending_cash = data.get("pending_cash")
+
+        cash = data.get("cash")
+        self.cash = CashAccountBalanceDetails.from_dict(cash) if cash else None
+        margin = data.get("margin")
+        self.margin = MarginAccountBalanceDetails.from_dict(margin) if margin else None
+        pdt = data.get("pdt")
+        self.pdt = PDTAccountBalanceDetails.from_dict(pdt) if pdt else None
 
     def to_dict(self):
         """
@@ -1,23 +1,44 @@
-from asynctradier.common import MarketStatus
+from types import MappingProxyType
 
+from asynctradier.common import MarketStatus, ResponseModel
+from asynctradier.utils.common import MemberLookup
 
-class Calendar:
+_MARKET_STATUSES = MemberLookup(MarketStatus)
+
+# shared read-only stand-in for a missing session window
+_EMPTY = MappingProxyType({})
+
+
+class Calendar(ResponseModel):
     """
     Represents a calendar object that contains information about market status and trading hours for a specific date.
     """
 
-    def __init__(self, **kwargs):
-        self.date = kwargs.get("date")
-        self.status = (
-            MarketStatus(kwargs.get("status")) if kwargs.get("status") else None
-        )
-        self.description = kwargs.get("description")
-        self.premarket_start = kwargs.get("premarket", {}).get("start")
-        self.premarket_end = kwargs.get("premarket", {}).get("end")
-        self.regular_start = kwargs.get("open", {}).get("start")
-        self.regular_end = kwargs.get("open", {}).get("end")
-        self.postmarket_start = kwargs.get("postmarket", {}).get("start")
-        self.postmarket_end = kwargs.get("postmarket", {}).get("end")
+    __slots__ = (
+        "date",
+        "status",
+        "description",
+        "premarket_start",
+        "premarket_end",
+        "regular_start",
+        "regular_end",
+        "postmarket_start",
+        "postmarket_end",
+    )
+
+    def _load(self, data: dict) -> None:
+        self.date = data.get("date")
+        self.status = _MARKET_STATUSES[data.get("status")]
+        self.description = data.get("description")
+        premarket = data.get("premarket") or _EMPTY
+        self.premarket_start = premarket.get("start")
+        self.premarket_end = premarket.get("end")
+        regular = data.get("open") or _EMPTY
+        self.regular_start = regular.get("start")
+        self.regular_end = regular.get("end")
+        postmarket = data.get("postmarket") or _EMPTY
+        self.postmarket_start = postmarket.get("start")
+        self.postmarket_end = postmarket.get("end")
 
     def to_dict(self):
         """
@@ -28,7 +49,7 @@ class Calendar:
         """
         return {
             "date": self.date,
-            "status": self.status.value,
+            "status": self.status.value if self.status is not None else None,
             "description": self.description,
             "premarket": {"start": self.premarket_start, "end": self.premarket_end},
             "open": {"start": self.regular_start, "end": self.regular_end},
@@ -1,7 +1,22 @@
-from asynctradier.common import EventType, TradeType
+from asynctradier.common import EventType, ResponseModel, TradeType
+from asynctradier.utils.common import MemberLookup, to_float
 
+_EVENT_TYPES = MemberLookup(EventType)
 
-class Event:
+# trade types come back capitalized ("Equity"), so the usual spellings are
+# mapped directly and only unexpected ones are lowercased
+_TRADE_TYPES = MemberLookup(
+    TradeType,
+    aliases={
+        spelling: member
+        for member in TradeType
+        for spelling in (member.value.capitalize(), member.value.upper())
+    },
+    normalize=str.lower,
+)
+
+
+class Event(ResponseModel):
     """
     Represents an event.
 
@@ -17,25 +32,32 @@ class Event:
         trade_type (TradeType): The type of trade.
     """
 
-    def __init__(self, **kwargs):
-        self.amount = float(kwargs.get("amount")) if kwargs.get("amount") else 0.0
-        self.date = kwargs.get("date")
-        self.type = EventType(kwargs.get("type")) if kwargs.get("type") else None
+    __slots__ = (
+        "amount",
+        "date",
+        "type",
+        "description",
+        "commision",
+        "price",
+        "quantity",
+        "symbol",
+        "trade_type",
+    )
+
+    def _load(self, data: dict) -> None:
+        self.amount = to_float(data.get("amount"))
+        self.date = data.get("date")
+        event_type = data.get("type")
+        self.type = _EVENT_TYPES[event_type]
 
-        detail = kwargs.get(self.type.value, {})
+        detail = data.get(event_type) or {}
 
         self.description = detail.get("description")
-        self.commision = (
-            float(detail.get("commision")) if detail.get("commision") else 0.0
-        )
-        self.price = float(detail.get("price")) if detail.get("price") else 0.0
-        self.quantity = float(detail.get("quantity")) if detail.get("quantity") else 0.0
+        self.commision = to_float(detail.get("commision"))
+        self.price = to_float(detail.get("price"))
+        self.quantity = to_float(detail.get("quantity"))
         self.symbol = detail.get("symbol")
-        self.trade_type = (
-            TradeType(detail.get("trade_type").lower())
-            if detail.get("trade_type")
-            else None
-        )
+        self.trade_type = _TRADE_TYPES[detail.get("trade_type")]
 
     def to_dict(self):
         """
@@ -47,12 +69,14 @@ class Event:
         return {
             "amount": self.amount,
             "date": self.date,
-            "type": self.type.value,
+            "type": self.type.value if self.type is not None else None,
             "description": self.description,
             "commision": self.commision,
             "price": self.price,
             "symbol": self.symbol,
-            "trade_type": self.trade_type.value,
+            "trade_type": (
+                self.trade_type.value if self.trade_type is not None else None
+            ),
             "quantity": self.quantity,
         }
 
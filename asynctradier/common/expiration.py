@@ -1,4 +1,7 @@
-class Expiration:
+from asynctradier.common import ResponseModel
+
+
+class Expiration(ResponseModel):
     """
     Represents an expiration date for a contract.
 
@@ -9,8 +12,17 @@ class Expiration:
         strikes (list): A list of strike prices.
     """
 
-    def __init__(self, **kwargs):
-        self.date = kwargs.get("date")
-        self.contract_size = kwargs.get("contract_size")
-        self.expiration_type = kwargs.get("expiration_type")
-        self.strikes = kwargs.get("strikes")
+    __slots__ = (
+        "date",
+        "contract_size",
+        "expiration_type",
+        "strikes",
+    )
+
+    def _load(self, data: dict) -> None:
+        self.date = data.get("date")
+        self.contract_size = data.get("contract_size")
+        self.expiration_type = data.get("expiration_type")
+        strikes = data.get("strikes")
+        # the API nests the list as {"strikes": {"strike": [...]}}
+        self.strikes = strikes["strike"] if type(strikes) is dict else strikes
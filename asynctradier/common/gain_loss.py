@@ -1,4 +1,8 @@
-class ProfitLoss:
+from asynctradier.common import ResponseModel
+from asynctradier.utils.common import to_float, to_int
+
+
+class ProfitLoss(ResponseModel):
     """
     ProfitLoss class for storing profit/loss information for a security.
 
@@ -14,22 +18,28 @@ class ProfitLoss:
         term (int): Term in months position was held
     """
 
-    def __init__(self, **kwargs):
-        self.close_date = kwargs.get("close_date")
-        self.cost = float(kwargs.get("cost")) if kwargs.get("cost") else 0.0
-        self.gain_loss = (
-            float(kwargs.get("gain_loss")) if kwargs.get("gain_loss") else 0.0
-        )
-        self.gain_loss_percent = (
-            float(kwargs.get("gain_loss_percent"))
-            if kwargs.get("gain_loss_percent")
-            else 0.0
-        )
-        self.open_date = kwargs.get("open_date")
-        self.proceeds = float(kwargs.get("proceeds")) if kwargs.get("proceeds") else 0.0
-        self.quantity = float(kwargs.get("quantity")) if kwargs.get("quantity") else 0.0
-        self.symbol = kwargs.get("symbol")
-        self.term = int(kwargs.get("term")) if kwargs.get("term") else 0
+    __slots__ = (
+        "close_date",
+        "cost",
+        "gain_loss",
+        "gain_loss_percent",
+        "open_date",
+        "proceeds",
+        "quantity",
+        "symbol",
+        "term",
+    )
+
+    def _load(self, data: dict) -> None:
+        self.close_date = data.get("close_date")
+        self.cost = to_float(data.get("cost"))
+        self.gain_loss = to_float(data.get("gain_loss"))
+        self.gain_loss_percent = to_float(data.get("gain_loss_percent"))
+        self.open_date = data.get("open_date")
+        self.proceeds = to_float(data.get("proceeds"))
+        self.quantity = to_float(data.get("quantity"))
+        self.symbol = data.get("symbol")
+        self.term = to_int(data.get("term"))
 
     def to_dict(self):
         """
@@ -1,7 +1,19 @@
-from asynctradier.common import MarketDataType
+from sys import intern
+from typing import Iterable, List, Union
 
+from asynctradier.common import MarketDataType, ResponseModel
+from asynctradier.utils.common import MemberLookup, json_loads
 
-class MarketData:
+# every frame carries a type, so a missing one raises like an unknown one
+_MARKET_DATA_TYPES = MemberLookup(MarketDataType, required=True)
+
+
+def _intern(value):
+    # symbols and exchange codes repeat on every tick, so keep one shared copy
+    return intern(value) if type(value) is str else value
+
+
+class MarketData(ResponseModel):
     """
     Represents market data for a specific type.
 
@@ -13,16 +25,41 @@ class MarketData:
         data (MarketDataTrade, MarketDataQuote, MarketDataSummary, MarketDataTimesale): The specific market data object based on the type.
     """
 
-    def __init__(self, **kwargs):
-        self.type = MarketDataType(kwargs.get("type"))
-        if self.type in [MarketDataType.trade, MarketDataType.tradex]:
-            self.data = MarketDataTrade(**kwargs)
-        elif self.type == MarketDataType.quote:
-            self.data = MarketDataQuote(**kwargs)
-        elif self.type == MarketDataType.summary:
-            self.data = MarketDataSummary(**kwargs)
-        elif self.type == MarketDataType.timesale:
-            self.data = MarketDataTimesale(**kwargs)
+    __slots__ = (
+        "type",
+        "data",
+    )
+
+    @classmethod
+    def from_frames(cls, frames: Iterable[Union[str, bytes]]) -> List["MarketData"]:
+        """
+        Decode a batch of raw stream frames into MarketData objects in one pass.
+
+        Args:
+            frames (Iterable[Union[str, bytes]]): The raw JSON stream messages.
+
+        Returns:
+            List[MarketData]: The MarketData objects, in frame order.
+        """
+        from_dict = cls.from_dict
+        return [from_dict(json_loads(frame)) for frame in frames]
+
+    @classmethod
+    def from_json(cls, frame: Union[str, bytes]) -> "MarketData":
+        """
+        Create a MarketData object straight from a raw stream frame.
+
+        Args:
+            frame (Union[str, bytes]): The raw JSON stream message.
+
+        Returns:
+            MarketData: The MarketData object.
+        """
+        return cls.from_dict(json_loads(frame))
+
+    def _load(self, data: dict) -> None:
+        self.type = _MARKET_DATA_TYPES[data.get("type")]
+        self.data = _MD_DISPATCH[self.type].from_dict(data)
 
     def to_string(self) -> str:
         """
@@ -46,7 +83,7 @@ class MarketData:
         return self.to_string()
 
 
-class MarketDataQuote:
+class MarketDataQuote(ResponseModel):
     """
     Represents a market data quote.
     The quote event is issued when a viable quote has been created an exchange. This represents the most current bid/ask pricing available.
@@ -63,16 +100,28 @@ class MarketDataQuote:
         askdate (str): The date of the ask.
     """
 
-    def __init__(self, **kwargs):
-        self.symbol = kwargs.get("symbol")
-        self.bid = kwargs.get("bid")
-        self.bidsz = kwargs.get("bidsz")
-        self.bidexch = kwargs.get("bidexch")
-        self.biddate = kwargs.get("biddate")
-        self.ask = kwargs.get("ask")
-        self.asksz = kwargs.get("asksz")
-        self.askexch = kwargs.get("askexch")
-        self.askdate = kwargs.get("askdate")
+    __slots__ = (
+        "symbol",
+        "bid",
+        "bidsz",
+        "bidexch",
+        "biddate",
+        "ask",
+        "asksz",
+        "askexch",
+        "askdate",
+    )
+
+    def _load(self, data: dict) -> None:
+        self.symbol = _intern(data.get("symbol"))
+        self.bid = data.get("bid")
+        self.bidsz = data.get("bidsz")
+        self.bidexch = _intern(data.get("bidexch"))
+        self.biddate = data.get("biddate")
+        self.ask = data.get("ask")
+        self.asksz = data.get("asksz")
+        self.askexch = _intern(data.get("askexch"))
+        self.askdate = data.get("askdate")
 
     def to_string(self):
         """
@@ -106,7 +155,7 @@ class MarketDataQuote:
         return self.to_string()
 
 
-class MarketDataTrade:
+class MarketDataTrade(ResponseModel):
     """
     Represents a market data trade.
     The trade event is sent for all trade events at exchanges. By default, the trade event is filtered to only include valid ticks (removing trade corrections, errors, etc).
@@ -121,14 +170,24 @@ class MarketDataTrade:
         last (str): The last price of the trade.
     """
 
-    def __init__(self, **kwargs):
-        self.symbol = kwargs.get("symbol")
-        self.exch = kwargs.get("exch")
-        self.price = kwargs.get("price")
-        self.size = kwargs.get("size")
-        self.cvol = kwargs.get("cvol")
-        self.date = kwargs.get("date")
-        self.last = kwargs.get("last")
+    __slots__ = (
+        "symbol",
+        "exch",
+        "price",
+        "size",
+        "cvol",
+        "date",
+        "last",
+    )
+
+    def _load(self, data: dict) -> None:
+        self.symbol = _intern(data.get("symbol"))
+        self.exch = _intern(data.get("exch"))
+        self.price = data.get("price")
+        self.size = data.get("size")
+        self.cvol = data.get("cvol")
+        self.date = data.get("date")
+        self.last = data.get("last")
 
     def to_string(self):
         """
@@ -160,7 +219,7 @@ class MarketDataTrade:
         return self.to_string()
 
 
-class MarketDataSummary:
+class MarketDataSummary(ResponseModel):
     """
     Represents a market data summary.
     The summary event is triggered when a market session high, low, open, or close event is triggered.
@@ -174,12 +233,20 @@ class MarketDataSummary:
         prev_close (float): The previous closing price of the summary.
     """
 
-    def __init__(self, **kwargs):
-        self.symbol = kwargs.get("symbol")
-        self.open = kwargs.get("open")
-        self.high = kwargs.get("high")
-        self.low = kwargs.get("low")
-        self.prev_close = kwargs.get("prevClose")
+    __slots__ = (
+        "symbol",
+        "open",
+        "high",
+        "low",
+        "prev_close",
+    )
+
+    def _load(self, data: dict) -> None:
+        self.symbol = _intern(data.get("symbol"))
+        self.open = data.get("open")
+        self.high = data.get("high")
+        self.low = data.get("low")
+        self.prev_close = data.get("prevClose")
 
     def to_string(self):
         """
@@ -209,7 +276,7 @@ class MarketDataSummary:
         return self.to_string()
 
 
-class MarketDataTimesale:
+class MarketDataTimesale(ResponseModel):
     """
     Represents a market data timesale.
     Time and Sale represents a trade or other market event with price, like market open/close price, etc. Time and Sales are intended to provide information about trades in a continuous time slice (unlike Trade events which are supposed to provide snapshot about the current last trade). Timesale events are uniquely sequenced.
@@ -229,19 +296,34 @@ class MarketDataTimesale:
         session (str): The session of the timesale.
     """
 
-    def __init__(self, **kwargs):
-        self.symbol = kwargs.get("symbol")
-        self.exch = kwargs.get("exch")
-        self.bid = kwargs.get("bid")
-        self.ask = kwargs.get("ask")
-        self.last = kwargs.get("last")
-        self.size = kwargs.get("size")
-        self.date = kwargs.get("date")
-        self.seq = kwargs.get("seq")
-        self.flag = kwargs.get("flag")
-        self.cancel = kwargs.get("cancel")
-        self.correction = kwargs.get("correction")
-        self.session = kwargs.get("session")
+    __slots__ = (
+        "symbol",
+        "exch",
+        "bid",
+        "ask",
+        "last",
+        "size",
+        "date",
+        "seq",
+        "flag",
+        "cancel",
+        "correction",
+        "session",
+    )
+
+    def _load(self, data: dict) -> None:
+        self.symbol = _intern(data.get("symbol"))
+        self.exch = _intern(data.get("exch"))
+        self.bid = data.get("bid")
+        self.ask = data.get("ask")
+        self.last = data.get("last")
+        self.size = data.get("size")
+        self.date = data.get("date")
+        self.seq = data.get("seq")
+        self.flag = data.get("flag")
+        self.cancel = data.get("cancel")
+        self.correction = data.get("correction")
+        self.session = data.get("session")
 
     def to_string(self):
         """
@@ -276,3 +358,13 @@ class MarketDataTimesale:
 
     def __repr__(self) -> str:
         return self.to_string()
+
+
+# payload class for each stream message type, looked up once per frame
+_MD_DISPATCH = {
+    MarketDataType.trade: MarketDataTrade,
+    MarketDataType.tradex: MarketDataTrade,
+    MarketDataType.quote: MarketDataQuote,
+    MarketDataType.summary: MarketDataSummary,
+    MarketDataType.timesale: MarketDataTimesale,
+}
@@ -20,6 +20,15 @@ class OptionContract:
         quantity (int): The quantity of the option contract.
     """
 
+    __slots__ = (
+        "symbol",
+        "expiration_date",
+        "strike",
+        "option_type",
+        "order_side",
+        "quantity",
+    )
+
     def __init__(
         self,
         symbol: str,
@@ -42,7 +51,7 @@ class OptionContract:
         self.quantity = quantity
 
     def __str__(self) -> str:
-        return f"{self.order_side.value} {build_option_symbol(self.symbol, self.expiration_date, self.strike, self.option_type)}"
+        return f"{self.order_side.value} {self.option_symbol}"
 
     @property
     def option_symbol(self) -> str:
@@ -50,7 +59,8 @@ class OptionContract:
         Returns the option symbol for the contract.
 
         The option symbol is built using the contract's symbol, expiration date,
-        strike price, and option type.
+        strike price, and option type. build_option_symbol is memoized, so
+        repeated reads are cheap and still follow changes to the contract.
 
         Returns:
             str: The option symbol.
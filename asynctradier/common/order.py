@@ -2,10 +2,28 @@
 This module defines the Order class, which represents an order in a trading system.
 """
 
-from asynctradier.common import Duration, OrderClass, OrderSide, OrderStatus, OrderType
+from asynctradier.common import (
+    Duration,
+    OrderClass,
+    OrderSide,
+    OrderStatus,
+    OrderType,
+    ResponseModel,
+)
+from asynctradier.utils.common import MemberLookup
 
+# raw API values resolve to enum members with a plain dict lookup
+_ORDER_TYPES = MemberLookup(OrderType)
+_ORDER_SIDES = MemberLookup(OrderSide)
+_ORDER_STATUSES = MemberLookup(OrderStatus)
+_DURATIONS = MemberLookup(Duration)
+_ORDER_CLASSES = MemberLookup(OrderClass)
 
-class Order:
+# shared stand-in for a missing leg list, so no empty list is built per order
+_NO_LEGS = ()
+
+
+class Order(ResponseModel):
     """
     Represent an Order object.
 
@@ -34,34 +52,49 @@ class Order:
         legs (list[Order]): The legs of the order.
     """
 
-    def __init__(
-        self,
-        **kwargs,
-    ) -> None:
-        assert kwargs.get("id", None) is not None
-        self.id = kwargs["id"]
-        self.type = OrderType(kwargs["type"]) if kwargs.get("type", None) else None
-        self.symbol = kwargs.get("symbol", None)
-        self.side = OrderSide(kwargs["side"]) if kwargs.get("side", None) else None
-        self.quantity = kwargs.get("quantity", None)
-        self.status = (
-            OrderStatus(kwargs["status"]) if kwargs.get("status", None) else None
-        )
-        self.duration = (
-            Duration(kwargs["duration"]) if kwargs.get("duration", None) else None
-        )
-        self.avg_fill_price = kwargs.get("avg_fill_price", None)
-        self.exec_quantity = kwargs.get("exec_quantity", None)
-        self.last_fill_price = kwargs.get("last_fill_price", None)
-        self.last_fill_quantity = kwargs.get("last_fill_quantity", None)
-        self.remaining_quantity = kwargs.get("remaining_quantity", None)
-        self.create_date = kwargs.get("create_date", None)
-        self.transaction_date = kwargs.get("transaction_date", None)
-        self.class_ = OrderClass(kwargs["class"]) if kwargs.get("class", None) else None
-        self.option_symbol = kwargs.get("option_symbol", None)
-        self.price = kwargs.get("price", None)
-        self.number_of_legs = kwargs.get("num_legs", None)
-        self.legs = [Order(**leg) for leg in kwargs.get("leg", [])]
+    __slots__ = (
+        "id",
+        "type",
+        "symbol",
+        "side",
+        "quantity",
+        "status",
+        "duration",
+        "avg_fill_price",
+        "exec_quantity",
+        "last_fill_price",
+        "last_fill_quantity",
+        "remaining_quantity",
+        "create_date",
+        "transaction_date",
+        "class_",
+        "option_symbol",
+        "price",
+        "number_of_legs",
+        "legs",
+    )
+
+    def _load(self, data: dict) -> None:
+        assert data.get("id", None) is not None
+        self.id = data["id"]
+        self.type = _ORDER_TYPES[data.get("type")]
+        self.symbol = data.get("symbol", None)
+        self.side = _ORDER_SIDES[data.get("side")]
+        self.quantity = data.get("quantity", None)
+        self.status = _ORDER_STATUSES[data.get("status")]
+        self.duration = _DURATIONS[data.get("duration")]
+        self.avg_fill_price = data.get("avg_fill_price", None)
+        self.exec_quantity = data.get("exec_quantity", None)
+        self.last_fill_price = data.get("last_fill_price", None)
+        self.last_fill_quantity = data.get("last_fill_quantity", None)
+        self.remaining_quantity = data.get("remaining_quantity", None)
+        self.create_date = data.get("create_date", None)
+        self.transaction_date = data.get("transaction_date", None)
+        self.class_ = _ORDER_CLASSES[data.get("class")]
+        self.option_symbol = data.get("option_symbol", None)
+        self.price = data.get("price", None)
+        self.number_of_legs = data.get("num_legs", None)
+        self.legs = [Order.from_dict(leg) for leg in data.get("leg") or _NO_LEGS]
 
     def __str__(self) -> str:
         """
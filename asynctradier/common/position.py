@@ -1,4 +1,7 @@
-class Position:
+from asynctradier.common import ResponseModel
+
+
+class Position(ResponseModel):
     """
     Represents a trading position.
 
@@ -9,11 +12,18 @@ class Position:
         date_acquired (str): The date when the position was acquired.
     """
 
-    def __init__(self, **kwargs) -> None:
-        self.symbol = kwargs.get("symbol", None)
-        self.quantity = kwargs.get("quantity", None)
-        self.cost_basis = kwargs.get("cost_basis", None)
-        self.date_acquired = kwargs.get("date_acquired", None)
+    __slots__ = (
+        "symbol",
+        "quantity",
+        "cost_basis",
+        "date_acquired",
+    )
+
+    def _load(self, data: dict) -> None:
+        self.symbol = data.get("symbol", None)
+        self.quantity = data.get("quantity", None)
+        self.cost_basis = data.get("cost_basis", None)
+        self.date_acquired = data.get("date_acquired", None)
 
     def __str__(self) -> str:
         return (
@@ -1,7 +1,11 @@
-from asynctradier.common import OptionType, QuoteType
+from asynctradier.common import OptionType, QuoteType, ResponseModel
+from asynctradier.utils.common import MemberLookup
 
+_QUOTE_TYPES = MemberLookup(QuoteType)
+_OPTION_TYPES = MemberLookup(OptionType)
 
-class Greeks:
+
+class Greeks(ResponseModel):
     """
     Represents the Greeks of an option contract.
 
@@ -19,21 +23,35 @@ class Greeks:
         updated_at (str): The timestamp when the Greeks were last updated.
     """
 
-    def __init__(self, **kwargs):
-        self.delta = kwargs.get("delta")
-        self.gamma = kwargs.get("gamma")
-        self.theta = kwargs.get("theta")
-        self.vega = kwargs.get("vega")
-        self.rho = kwargs.get("rho")
-        self.phi = kwargs.get("phi")
-        self.bid_iv = kwargs.get("bid_iv")
-        self.mid_iv = kwargs.get("mid_iv")
-        self.ask_iv = kwargs.get("ask_iv")
-        self.smv_vol = kwargs.get("smv_vol")
-        self.updated_at = kwargs.get("updated_at")
-
-
-class Quote:
+    __slots__ = (
+        "delta",
+        "gamma",
+        "theta",
+        "vega",
+        "rho",
+        "phi",
+        "bid_iv",
+        "mid_iv",
+        "ask_iv",
+        "smv_vol",
+        "updated_at",
+    )
+
+    def _load(self, data: dict) -> None:
+        self.delta = data.get("delta")
+        self.gamma = data.get("gamma")
+        self.theta = data.get("theta")
+        self.vega = data.get("vega")
+        self.rho = data.get("rho")
+        self.phi = data.get("phi")
+        self.bid_iv = data.get("bid_iv")
+        self.mid_iv = data.get("mid_iv")
+        self.ask_iv = data.get("ask_iv")
+        self.smv_vol = data.get("smv_vol")
+        self.updated_at = data.get("updated_at")
+
+
+class Quote(ResponseModel):
     """
     Represents a quote for a financial instrument.
 
@@ -79,54 +97,111 @@ class Quote:
         vwap (float, optional): The volume-weighted average price of the financial instrument.
     """
 
-    def __init__(self, **kwargs):
-        self.symbol = kwargs.get("symbol")
-        self.description = kwargs.get("description")
-        self.exch = kwargs.get("exch")
-        self.type = QuoteType(kwargs.get("type")) if kwargs.get("type") else None
-        self.last = kwargs.get("last")
-        self.change = kwargs.get("change")
-        self.volume = kwargs.get("volume")
-        self.open = kwargs.get("open")
-        self.high = kwargs.get("high")
-        self.low = kwargs.get("low")
-        self.close = kwargs.get("close")
-        self.bid = kwargs.get("bid")
-        self.ask = kwargs.get("ask")
-        self.underlying = kwargs.get("underlying", None)
-        self.strike = kwargs.get("strike", None)
-        self.change_percentage = kwargs.get("change_percentage")
-        self.average_volume = kwargs.get("average_volume")  # 90 day average volume
-        self.last_volume = kwargs.get("last_volume")  # volume of last price
-        self.trade_date = kwargs.get("trade_date")  # most recent trade date
-        self.prevclose = kwargs.get("prevclose")
-        self.week_52_high = kwargs.get("week_52_high")
-        self.week_52_low = kwargs.get("week_52_low")
-        self.bidsize = kwargs.get("bidsize")  # in hundreds
-        self.bidexch = kwargs.get("bidexch")
-        self.bid_date = kwargs.get("bid_date")
-        self.asksize = kwargs.get("asksize")
-        self.askexch = kwargs.get("askexch")
-        self.ask_date = kwargs.get("ask_date")
-        self.open_interest = kwargs.get(
+    __slots__ = (
+        "symbol",
+        "description",
+        "exch",
+        "type",
+        "last",
+        "change",
+        "volume",
+        "open",
+        "high",
+        "low",
+        "close",
+        "bid",
+        "ask",
+        "underlying",
+        "strike",
+        "change_percentage",
+        "average_volume",
+        "last_volume",
+        "trade_date",
+        "prevclose",
+        "week_52_high",
+        "week_52_low",
+        "bidsize",
+        "bidexch",
+        "bid_date",
+        "asksize",
+        "askexch",
+        "ask_date",
+        "open_interest",
+        "contract_size",
+        "expiration_date",
+        "expiration_type",
+        "option_type",
+        "root_symbols",
+        "root_symbol",
+        "_greeks",
+        "note",
+        "date",
+        "vwap",
+    )
+
+    def _load(self, data: dict) -> None:
+        self.symbol = data.get("symbol")
+        self.description = data.get("description")
+        self.exch = data.get("exch")
+        self.type = _QUOTE_TYPES[data.get("type")]
+        self.last = data.get("last")
+        self.change = data.get("change")
+        self.volume = data.get("volume")
+        self.open = data.get("open")
+        self.high = data.get("high")
+        self.low = data.get("low")
+        self.close = data.get("close")
+        self.bid = data.get("bid")
+        self.ask = data.get("ask")
+        self.underlying = data.get("underlying", None)
+        self.strike = data.get("strike", None)
+        self.change_percentage = data.get("change_percentage")
+        self.average_volume = data.get("average_volume")  # 90 day average volume
+        self.last_volume = data.get("last_volume")  # volume of last price
+        self.trade_date = data.get("trade_date")  # most recent trade date
+        self.prevclose = data.get("prevclose")
+        self.week_52_high = data.get("week_52_high")
+        self.week_52_low = data.get("week_52_low")
+        self.bidsize = data.get("bidsize")  # in hundreds
+        self.bidexch = data.get("bidexch")
+        self.bid_date = data.get("bid_date")
+        self.asksize = data.get("asksize")
+        self.askexch = data.get("askexch")
+        self.ask_date = data.get("ask_date")
+        self.open_interest = data.get(
             "open_interest", None
         )  # open interest for options
-        self.contract_size = kwargs.get("contract_size", None)
-        self.expiration_date = kwargs.get("expiration_date", None)
-        self.expiration_type = kwargs.get("expiration_type", None)
-        self.option_type = (
-            OptionType(kwargs.get("option_type"))
-            if kwargs.get("option_type", None)
-            else None
-        )
-        self.root_symbols = kwargs.get(
+        self.contract_size = data.get("contract_size", None)
+        self.expiration_date = data.get("expiration_date", None)
+        self.expiration_type = data.get("expiration_type", None)
+        self.option_type = _OPTION_TYPES[data.get("option_type")]
+        self.root_symbols = data.get(
             "root_symbols"
         )  # Comma-delimited list of option root symbols for an underlier
-        self.root_symbol = kwargs.get(
-            "root_symbol", None
-        )  # Root symbol for an underlier
-
-        self.greeks = Greeks(**kwargs.get("greeks")) if kwargs.get("greeks") else None
-        self.note = kwargs.get("note", None)
-        self.date = kwargs.get("date", None)
-        self.vwap = kwargs.get("vwap", None)
+        self.root_symbol = data.get("root_symbol", None)  # Root symbol for an underlier
+
+        # kept as the raw dict until first read, see the greeks property
+        self._greeks = data.get("greeks") or None
+        self.note = data.get("note", None)
+        self.date = data.get("date", None)
+        self.vwap = data.get("vwap", None)
+
+    @property
+    def greeks(self) -> Greeks:
+        """
+        Returns the Greeks of an option quote, or None when the quote has none.
+
+        The Greeks object is built from the response on first access, so
+        callers that only need prices skip the work.
+
+        Returns:
+            Greeks: The Greeks of the option.
+        """
+        greeks = self._greeks
+        if type(greeks) is dict:
+            greeks = self._greeks = Greeks.from_dict(greeks)
+        return greeks
+
+    @greeks.setter
+    def greeks(self, value: Greeks) -> None:
+        self._greeks = value
@@ -1,7 +1,10 @@
-from asynctradier.common import SecurityType
+from asynctradier.common import ResponseModel, SecurityType
+from asynctradier.utils.common import MemberLookup
 
+_SECURITY_TYPES = MemberLookup(SecurityType)
 
-class Security:
+
+class Security(ResponseModel):
     """
     Represents an ETB (Exchange Traded Bond) object.
 
@@ -12,11 +15,18 @@ class Security:
         exchange (str): The exchange where the ETB is traded.
     """
 
-    def __init__(self, **kargs):
-        self.symbol = kargs.get("symbol", None)
-        self.description = kargs.get("description", None)
-        self.type = SecurityType(kargs.get("type", None)) if kargs.get("type") else None
-        self.exchange = kargs.get("exchange", None)
+    __slots__ = (
+        "symbol",
+        "description",
+        "type",
+        "exchange",
+    )
+
+    def _load(self, data: dict) -> None:
+        self.symbol = data.get("symbol", None)
+        self.description = data.get("description", None)
+        self.type = _SECURITY_TYPES[data.get("type")]
+        self.exchange = data.get("exchange", None)
 
     def to_dict(self):
         """
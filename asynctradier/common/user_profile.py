@@ -1,7 +1,17 @@
-from asynctradier.common import AccountStatus, AccountType, Classification
+from asynctradier.common import (
+    AccountStatus,
+    AccountType,
+    Classification,
+    ResponseModel,
+)
+from asynctradier.utils.common import MemberLookup
 
+_CLASSIFICATIONS = MemberLookup(Classification, required=True)
+_ACCOUNT_STATUSES = MemberLookup(AccountStatus)
+_ACCOUNT_TYPES = MemberLookup(AccountType)
 
-class UserAccount:
+
+class UserAccount(ResponseModel):
     """
     Represents a user profile with various attributes.
 
@@ -18,23 +28,39 @@ class UserAccount:
         last_update_date (str): The date of the last update to the user profile.
     """
 
-    def __init__(self, **kwargs):
-        self.id = kwargs.get("id")
-        self.name = kwargs.get("name")
-        self.account_number = kwargs.get("account_number")
-        self.classification = Classification(kwargs.get("classification"))
-        self.date_created = kwargs.get("date_created")
-        self.day_trader = kwargs.get("day_trader")
-        self.option_level = (
-            int(kwargs.get("option_level")) if kwargs.get("option_level") else None
-        )
-        self.status = (
-            AccountStatus(kwargs.get("status")) if kwargs.get("status") else None
-        )
-        self.type = AccountType(kwargs.get("type")) if kwargs.get("type") else None
-        self.last_update_date = kwargs.get("last_update_date")
-
-    def __dict__(self):
+    __slots__ = (
+        "id",
+        "name",
+        "account_number",
+        "classification",
+        "date_created",
+        "day_trader",
+        "option_level",
+        "status",
+        "type",
+        "last_update_date",
+    )
+
+    def _load(self, data: dict) -> None:
+        self.id = data.get("id")
+        self.name = data.get("name")
+        self.account_number = data.get("account_number")
+        self.classification = _CLASSIFICATIONS[data.get("classification")]
+        self.date_created = data.get("date_created")
+        self.day_trader = data.get("day_trader")
+        option_level = data.get("option_level")
+        self.option_level = int(option_level) if option_level else None
+        self.status = _ACCOUNT_STATUSES[data.get("status")]
+        self.type = _ACCOUNT_TYPES[data.get("type")]
+        self.last_update_date = data.get("last_update_date")
+
+    def to_dict(self):
+        """
+        Converts the UserAccount object to a dictionary.
+
+        Returns:
+            dict: A dictionary representation of the UserAccount object.
+        """
         return {
             "id": self.id,
             "name": self.name,
@@ -103,3 +103,18 @@ class InvalidDateFormat(Exception):
         super().__init__(
             f"Date format {date} is not valid. Valid values is: YYYY-MM-DD"
         )
+
+
+class TradierAPIError(Exception):
+    """
+    Exception raised when a response does not contain the expected data.
+
+    Attributes:
+        key (str): The missing response key.
+        response (dict): The response that was received.
+    """
+
+    def __init__(self, key: str, response: dict) -> None:
+        self.key = key
+        self.response = response
+        super().__init__(f"Response has no {key}: {response}")
@@ -13,6 +13,12 @@ class TradierClient(AccountClient, TradingClient, MarketDataClient, StreamingCli
         account_id (str): The account ID.
         token (str): The API token.
         sandbox (bool, optional): Whether to use the sandbox environment. Defaults to False.
+
+    The client keeps one HTTP session open for all requests. Use it as an async
+    context manager, or call close() when done:
+
+        async with TradierClient(account_id, token) as client:
+            positions = await client.get_positions()
     """
 
     def __init__(self, account_id: str, token: str, sandbox: bool = False) -> None:
@@ -25,3 +31,15 @@ class TradierClient(AccountClient, TradingClient, MarketDataClient, StreamingCli
         self.sandbox = sandbox
 
         super().__init__(self.session, self.account_id, self.token, self.sandbox)
+
+    async def __aenter__(self) -> "TradierClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Closes the shared HTTP session and its pooled connections.
+        """
+        await self.session.close()
@@ -3,16 +3,62 @@
 """
 
 import re
-
-from asynctradier.exceptions import InvalidExiprationDate, InvalidOptionType
-
-
+from functools import lru_cache
+
+from asynctradier.exceptions import (
+    InvalidExiprationDate,
+    InvalidOptionType,
+    TradierAPIError,
+)
+
+# pick the fastest JSON decoder available: orjson, then pysimdjson, then the
+# standard library. All of them take bytes and return plain dicts and lists.
+try:
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover
+    try:
+        from simdjson import loads as json_loads
+    except ImportError:
+        from json import loads as json_loads
+
+# request bodies are encoded with orjson when it is installed. orjson returns
+# bytes, which are decoded so callers always get text to send.
+try:
+    from orjson import dumps as _orjson_dumps
+except ImportError:  # pragma: no cover
+    from json import dumps as json_dumps
+else:
+
+    def json_dumps(obj) -> str:
+        """
+        Serialize obj to a JSON string.
+
+        Args:
+            obj: The object to serialize.
+
+        Returns:
+            str: The JSON document.
+        """
+        return _orjson_dumps(obj).decode()
+
+
+# YYYY-MM-DD with month 01-12 and day 01-31
+_DATE_PATTERN = r"\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\d|3[01])"
+_DATE_RE = re.compile(rf"\A{_DATE_PATTERN}\Z")
+# YYYY-MM-DD HH:MM with hour 00-23 and minute 00-59
+_DATETIME_RE = re.compile(rf"\A{_DATE_PATTERN} (?:[01]\d|2[0-3]):[0-5]\d\Z")
+
+
+@lru_cache(maxsize=4096)
 def build_option_symbol(
     symbol: str, expiration_date: str, strike: float, option_type: str
 ) -> str:
     """
     Build an option symbol based on the given parameters.
 
+    Results are memoized, since orders are often placed repeatedly on the same
+    contracts.
+
     Args:
         symbol (str): The underlying symbol.
         expiration_date (str): The expiration date of the option in the format "YYYY-MM-DD".
@@ -34,6 +80,138 @@ def build_option_symbol(
     return f"{symbol.upper()}{expiration_date.replace('-', '')[2:]}{option_type.upper()[0]}{str(int(strike * 1000)).zfill(8)}"
 
 
+def dig(data, *keys, default=None):
+    """
+    Look up a nested value in an API response.
+
+    Missing keys, out of range indexes and placeholders such as "null" or None
+    in the middle of the path all return the default.
+
+    Args:
+        data: The response object.
+        *keys: The keys (or list indexes) to follow.
+        default (optional): The value returned when the path does not exist. Defaults to None.
+
+    Returns:
+        The nested value, or the default.
+    """
+    try:
+        for key in keys:
+            data = data[key]
+        return data
+    except (LookupError, TypeError):
+        return default
+
+
+def unwrap(response, key: str):
+    """
+    Return the required top-level field of an API response.
+
+    Args:
+        response: The response object.
+        key (str): The field to return.
+
+    Returns:
+        The field value.
+
+    Raises:
+        TradierAPIError: If the response has no such field.
+    """
+    value = response.get(key) if type(response) is dict else None
+    if value is None:
+        raise TradierAPIError(key, response)
+    return value
+
+
+def as_list(value) -> list:
+    """
+    Normalize a response field that may hold a list, a single item or nothing.
+
+    The API returns a single object instead of a one-element list, and None or
+    the string "null" when there are no items.
+
+    Args:
+        value: The response field.
+
+    Returns:
+        list: The items of the field.
+    """
+    if type(value) is list:
+        return value
+    if value is None or value == "null":
+        return []
+    return [value]
+
+
+def to_float(value) -> float:
+    """
+    Convert a numeric response field to a float.
+
+    Floats are returned as they are. Missing or empty values (None, "", 0)
+    become 0.0, and anything else, such as ints or numeric strings, is passed
+    to float().
+
+    Args:
+        value: The response field.
+
+    Returns:
+        float: The field as a float.
+    """
+    if type(value) is float:
+        return value
+    return float(value) if value else 0.0
+
+
+def to_int(value) -> int:
+    """
+    Convert an integer response field to an int.
+
+    Ints are returned as they are. Missing or empty values become 0, and
+    anything else is passed to int().
+
+    Args:
+        value: The response field.
+
+    Returns:
+        int: The field as an int.
+    """
+    if type(value) is int:
+        return value
+    return int(value) if value else 0
+
+
+class MemberLookup(dict):
+    """
+    Map raw API values to enum members with a single subscript.
+
+    Missing values (None or "") map to None, unless the field is required.
+    Known values and the given aliases map straight to their member. Anything
+    else is passed to the enum (after the optional normalize step), so unknown
+    values still raise ValueError.
+
+    Args:
+        enum_cls: The enum to look members up in.
+        aliases (dict, optional): Extra spellings mapped to members. Defaults to None.
+        normalize (callable, optional): Applied to unknown values before the enum call. Defaults to None.
+        required (bool, optional): Whether missing values raise ValueError instead of mapping to None. Defaults to False.
+    """
+
+    def __init__(self, enum_cls, aliases=None, normalize=None, required=False) -> None:
+        super().__init__(enum_cls._value2member_map_)
+        if aliases:
+            self.update(aliases)
+        if not required:
+            self[None] = None
+            self[""] = None
+        self._enum = enum_cls
+        self._normalize = normalize
+
+    def __missing__(self, value):
+        if self._normalize is not None:
+            value = self._normalize(value)
+        return self._enum(value)
+
+
 def is_valid_expiration_date(expiration: str) -> bool:
     """
     Check if the given expiration date is in the valid format.
@@ -45,7 +223,7 @@ def is_valid_expiration_date(expiration: str) -> bool:
         bool: True if the expiration date is valid, False otherwise.
     """
     # valid exp date is YYYY-MM-DD
-    return bool(re.match(r"\d{4}-\d{2}-\d{2}", expiration))
+    return _DATE_RE.match(expiration) is not None
 
 
 def is_valid_option_type(option_type: str) -> bool:
@@ -72,4 +250,4 @@ def is_valid_datetime(datetime: str) -> bool:
         bool: True if the datetime is valid, False otherwise.
     """
     # valid datetime is YYYY-MM-DD HH:MM
-    return bool(re.match(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}$", datetime))
+    return _DATETIME_RE.match(datetime) is not None
@@ -1,13 +1,26 @@
+import asyncio
 import urllib.parse
+from typing import Optional
 
 import aiohttp
 
 from asynctradier.exceptions import BadRequestException
+from asynctradier.utils.common import json_loads
+
+# REST calls are short, so fail fast instead of waiting out aiohttp's
+# five minute default when the API or the network stalls
+_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=5)
 
 
 class WebUtil:
     """
     A utility class for making asynchronous HTTP requests.
+
+    Requests made on the same event loop share one aiohttp.ClientSession, so
+    connections are kept alive and reused. A new session is opened when the
+    instance is used from another loop, e.g. across asyncio.run() calls. Call
+    close() (or use the instance as an async context manager) to release them.
+    Pass the same instance to every client so they share one connection pool.
     """
 
     def __init__(self, base_url: str, token: str):
@@ -20,6 +33,71 @@ class WebUtil:
         """
         self.base_url = base_url
         self.token = token
+        self._headers = {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/json",
+        }
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def __aenter__(self) -> "WebUtil":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Returns the shared client session, creating it on first use.
+
+        The session has to be created inside a running event loop, so it is
+        not built in __init__. A session is bound to the loop it was created
+        on, so a new one is opened when called from a different loop.
+
+        Returns:
+            aiohttp.ClientSession: The shared client session.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            self._drop_foreign_session(loop)
+            self._loop = loop
+            self._session = aiohttp.ClientSession(
+                headers=self._headers,
+                timeout=_TIMEOUT,
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=32,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60,
+                ),
+            )
+        return self._session
+
+    def _drop_foreign_session(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Forgets a session created on another event loop.
+
+        Such a session cannot be closed from the current loop, and its own loop
+        has usually finished already, taking the connections with it. It is
+        detached so it is not reported as unclosed.
+
+        Args:
+            loop (asyncio.AbstractEventLoop): The running event loop.
+        """
+        if self._session is not None and self._loop is not loop:
+            if not self._session.closed:
+                self._session.detach()
+            self._session = None
+
+    async def close(self) -> None:
+        """
+        Closes the shared client session and its connections.
+        """
+        self._drop_foreign_session(asyncio.get_running_loop())
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._loop = None
 
     async def make_request(
         self, url: str, method: str, params: dict = None, data: dict = None
@@ -34,26 +112,20 @@ class WebUtil:
             data (dict, optional): The request payload. Defaults to None.
 
         Returns:
-            dict: The JSON response from the request.
+            dict: The JSON response from the request, decoded from the raw body bytes.
 
         Raises:
             BadRequestException: If the request fails or returns an error.
         """
-        async with aiohttp.ClientSession() as session:
-            headers = {
-                "Authorization": f"Bearer {self.token}",
-                "Accept": "application/json",
-            }
-            async with session.request(
-                method, url, params=params, headers=headers, data=data
-            ) as resp:
-                if resp.status != 200:
-                    raise BadRequestException(resp.status, await resp.text())
-                response = await resp.json()
-
-                if "errors" in response:
-                    raise BadRequestException(400, response["errors"]["error"])
-                return response
+        session = self._get_session()
+        async with session.request(method, url, params=params, data=data) as resp:
+            if resp.status != 200:
+                raise BadRequestException(resp.status, await resp.text())
+            response = json_loads(await resp.read())
+
+            if "errors" in response:
+                raise BadRequestException(400, response["errors"]["error"])
+            return response
 
     async def get(self, path: str, params: dict = None):
         """
@@ -1,3 +1,5 @@
+import pytest
+
 from asynctradier.common import (
     AccountStatus,
     AccountType,
@@ -5,13 +7,16 @@ from asynctradier.common import (
     Duration,
     EventType,
     MarketDataType,
+    MarketStatus,
     OptionType,
     OrderClass,
     OrderSide,
     OrderStatus,
     OrderType,
     QuoteType,
+    ResponseModel,
     SecurityType,
+    TradeType,
 )
 from asynctradier.common.account_balance import (
     AccountBalance,
@@ -26,7 +31,7 @@ from asynctradier.common.gain_loss import ProfitLoss
 from asynctradier.common.market_data import MarketData
 from asynctradier.common.option_contract import OptionContract
 from asynctradier.common.order import Order
-from asynctradier.common.quote import Quote
+from asynctradier.common.quote import Greeks, Quote
 from asynctradier.common.security import Security
 from asynctradier.common.user_profile import UserAccount
 from asynctradier.exceptions import InvalidExiprationDate, InvalidOptionType
@@ -352,6 +357,42 @@ def test_order_multileg():
         assert order_leg.option_symbol == leg["option_symbol"]
 
 
+def test_order_from_dict():
+    order_info = {
+        "id": 228175,
+        "type": "limit",
+        "symbol": "AAPL",
+        "side": "buy",
+        "quantity": 50.00000000,
+        "status": "open",
+        "duration": "day",
+        "price": 22.0,
+        "class": "equity",
+    }
+
+    order = Order.from_dict(order_info)
+
+    assert isinstance(order, Order)
+    assert order.id == 228175
+    assert order.type == OrderType.limit
+    assert order.side == OrderSide.buy
+    assert order.status == OrderStatus.open
+    assert order.duration == Duration.day
+    assert order.class_ == OrderClass.equity
+    assert order.legs == []
+    assert not hasattr(order, "__dict__")
+
+
+def test_order_unknown_status():
+    order = Order.from_dict({"id": 1, "type": "market", "status": ""})
+
+    assert order.type is OrderType.market
+    assert order.status is None
+
+    with pytest.raises(ValueError):
+        Order.from_dict({"id": 1, "status": "bogus"})
+
+
 def test_option_contract():
     contract = OptionContract(
         "SPY",
@@ -369,6 +410,25 @@ def test_option_contract():
     assert contract.order_side == OrderSide.buy_to_open
     assert contract.quantity == 1
     assert contract.option_symbol == "SPY190329C00274000"
+    assert contract.option_symbol is contract.option_symbol
+    assert str(contract) == "buy_to_open SPY190329C00274000"
+
+
+def test_option_contract_symbol_follows_changes():
+    contract = OptionContract(
+        "SPY",
+        "2019-03-29",
+        274.00,
+        OptionType.call,
+        OrderSide.buy_to_open,
+        1,
+    )
+    assert contract.option_symbol == "SPY190329C00274000"
+
+    contract.strike = 280.0
+
+    assert contract.option_symbol == "SPY190329C00280000"
+    assert str(contract) == "buy_to_open SPY190329C00280000"
 
 
 def test_option_contract_invalid_exp_date():
@@ -529,6 +589,8 @@ def test_quote_option():
     assert quote.ask == 28.75
     assert quote.underlying == "TSLA"
     assert quote.strike == 250.0
+    assert isinstance(quote.greeks, Greeks)
+    assert quote.greeks is quote.greeks
     assert quote.greeks.delta == -0.9604526529331165
     assert quote.greeks.gamma == 0.005467830085355449
     assert quote.greeks.theta == -0.08873705325377128
@@ -561,6 +623,30 @@ def test_quote_option():
     assert quote.root_symbol == "TSLA"
 
 
+def test_quote_from_dict():
+    quote_info = {
+        "symbol": "SPY",
+        "type": "option",
+        "option_type": "call",
+        "bid": 1.5,
+        "ask": 1.6,
+        "greeks": {"delta": 0.5},
+    }
+
+    quote = Quote.from_dict(quote_info)
+
+    assert isinstance(quote, Quote)
+    assert quote.symbol == "SPY"
+    assert quote.type == QuoteType.option
+    assert quote.option_type == OptionType.call
+    assert quote.bid == 1.5
+    assert quote.ask == 1.6
+    assert quote.greeks.delta == 0.5
+    assert quote.note is None
+    assert not hasattr(quote, "__dict__")
+    assert not hasattr(quote.greeks, "__dict__")
+
+
 def test_expirations():
     expiration_info = {
         "date": "2023-11-10",
@@ -594,6 +680,22 @@ def test_expirations():
     assert len(expirations.strikes) == len(expiration_info["strikes"])
 
 
+def test_expiration_from_dict_nested_strikes():
+    expiration_info = {
+        "date": "2023-11-10",
+        "contract_size": 100,
+        "expiration_type": "weeklys",
+        "strikes": {"strike": [20.0, 20.5]},
+    }
+
+    expiration = Expiration.from_dict(expiration_info)
+
+    assert expiration.date == "2023-11-10"
+    assert expiration.strikes == [20.0, 20.5]
+    assert expiration_info["strikes"] == {"strike": [20.0, 20.5]}
+    assert not hasattr(expiration, "__dict__")
+
+
 def test_userprofile():
     userprofile_info = {
         "id": "id-gcostanza",
@@ -620,6 +722,18 @@ def test_userprofile():
     assert account.status == AccountStatus.active
     assert account.type == AccountType.margin
     assert account.last_update_date == userprofile_info["last_update_date"]
+    with pytest.raises(AttributeError):
+        account.nickname = "George"
+
+    assert account.to_dict() == userprofile_info
+
+
+def test_userprofile_invalid_classification():
+    with pytest.raises(ValueError):
+        UserAccount(id="id-gcostanza", classification="corporate")
+
+    with pytest.raises(ValueError):
+        UserAccount(id="id-gcostanza")
 
 
 def test_cashbalancedetail():
@@ -949,6 +1063,30 @@ def test_journal():
     assert event.quantity == detail["journal"]["quantity"]
 
 
+def test_event_to_dict_missing_types():
+    event = Event.from_dict({"amount": -3000.00, "date": "2018-05-23T00:00:00Z"})
+
+    assert event.type is None
+    assert event.trade_type is None
+    dictionary = event.to_dict()
+    assert dictionary["type"] is None
+    assert dictionary["trade_type"] is None
+
+    journal = Event(type="journal", journal={"description": "transfer"})
+    assert journal.to_dict()["trade_type"] is None
+
+
+def test_event_trade_type_spellings():
+    for spelling in ("Equity", "equity", "EQUITY", "eQuity"):
+        event = Event(type="trade", trade={"trade_type": spelling})
+        assert event.trade_type is TradeType.equity
+
+
+def test_calendar_to_dict_missing_status():
+    calendar = Calendar(date="2024-01-01")
+    assert calendar.to_dict()["status"] is None
+
+
 def test_gainloss_equity():
     detail = {
         "close_date": "2018-09-19T00:00:00.000Z",
@@ -973,6 +1111,7 @@ def test_gainloss_equity():
     assert gainloss.quantity == detail["quantity"]
     assert gainloss.symbol == detail["symbol"]
     assert gainloss.term == detail["term"]
+    assert not hasattr(gainloss, "__dict__")
 
 
 def test_gainloss_option():
@@ -1038,6 +1177,22 @@ def test_calendar_open():
     assert calendar.postmarket_end == detail["postmarket"]["end"]
 
 
+def test_calendar_status_member():
+    calendar = Calendar.from_dict({"date": "2024-01-02", "status": "open"})
+    assert calendar.status is MarketStatus.open
+
+    with pytest.raises(ValueError):
+        Calendar(date="2024-01-02", status="halted")
+
+
+def test_calendar_null_sessions():
+    calendar = Calendar.from_dict(
+        {"date": "2024-01-01", "status": "closed", "premarket": None}
+    )
+    assert calendar.premarket_start is None
+    assert calendar.regular_end is None
+
+
 def test_market_data_quote():
     detail = {
         "type": "quote",
@@ -1124,6 +1279,66 @@ def test_market_data_trade():
     )
 
 
+def test_market_data_from_dict():
+    detail = {
+        "type": "quote",
+        "symbol": "SPY",
+        "bid": 281.84,
+        "ask": 281.85,
+    }
+
+    market_data = MarketData.from_dict(detail)
+
+    assert isinstance(market_data, MarketData)
+    assert market_data.type == MarketDataType.quote
+    assert market_data.data.symbol == "SPY"
+    assert market_data.data.bid == 281.84
+    assert market_data.data.ask == 281.85
+    assert not hasattr(market_data, "__dict__")
+    assert not hasattr(market_data.data, "__dict__")
+
+
+def test_market_data_unknown_type():
+    with pytest.raises(ValueError):
+        MarketData.from_dict({"type": "bogus", "symbol": "SPY"})
+
+    with pytest.raises(ValueError):
+        MarketData.from_dict({"symbol": "SPY"})
+
+
+def test_market_data_from_json():
+    market_data = MarketData.from_json(
+        b'{"type": "trade", "symbol": "SPY", "exch": "J", "price": "281.1"}'
+    )
+
+    assert market_data.type == MarketDataType.trade
+    assert market_data.data.exch == "J"
+    assert market_data.data.price == "281.1"
+
+
+def test_market_data_from_frames():
+    frames = [
+        '{"type": "quote", "symbol": "SPY", "bid": 281.84, "ask": 281.85}',
+        b'{"type": "summary", "symbol": "SPY", "open": "281.01"}',
+    ]
+
+    market_data = MarketData.from_frames(frames)
+
+    assert [md.type for md in market_data] == [
+        MarketDataType.quote,
+        MarketDataType.summary,
+    ]
+    assert market_data[0].data.bid == 281.84
+    assert market_data[1].data.open == "281.01"
+
+
+def test_market_data_interns_symbol():
+    first = MarketData.from_dict({"type": "trade", "symbol": "".join(["S", "PY"])})
+    second = MarketData.from_dict({"type": "trade", "symbol": "".join(["S", "PY"])})
+
+    assert first.data.symbol is second.data.symbol
+
+
 def test_market_data_timesale():
     detail = {
         "type": "timesale",
@@ -1267,3 +1482,26 @@ def test_etb():
     assert etb.exchange == detail["exchange"]
     assert etb.type == SecurityType.stock
     assert etb.description == detail["description"]
+
+
+def test_security_from_dict():
+    detail = {"symbol": "SCS", "exchange": "N", "type": "stock"}
+
+    etb = Security.from_dict(detail)
+
+    assert isinstance(etb, ResponseModel)
+    assert etb.symbol == "SCS"
+    assert etb.type is SecurityType.stock
+    assert etb.description is None
+    assert not hasattr(etb, "__dict__")
+
+
+def test_response_model_requires_load():
+    class Incomplete(ResponseModel):
+        __slots__ = ()
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+    with pytest.raises(TypeError):
+        Incomplete.from_dict({})
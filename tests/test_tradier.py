@@ -1,7 +1,13 @@
+import asyncio
+import gc
 from unittest.mock import call
 
 import pytest
 
+from asynctradier.clients.account_clients import AccountClient
+from asynctradier.clients.marketdata_client import MarketDataClient
+from asynctradier.clients.streaming_client import StreamingClient
+from asynctradier.clients.trading_client import TradingClient
 from asynctradier.common import (
     AccountType,
     Duration,
@@ -13,12 +19,15 @@ from asynctradier.common import (
 from asynctradier.common.option_contract import OptionContract
 from asynctradier.exceptions import (
     APINotAvailable,
+    BadRequestException,
     InvalidDateFormat,
     InvalidExiprationDate,
     InvalidParameter,
     MissingRequiredParameter,
+    TradierAPIError,
 )
 from asynctradier.tradier import TradierClient
+from asynctradier.utils.webutils import WebUtil
 
 
 def test_tradier_init():
@@ -33,6 +42,47 @@ def test_tradier_init():
     assert tradier_client.session.base_url == "https://api.tradier.com"
 
 
+@pytest.mark.asyncio
+async def test_tradier_context_manager(mocker):
+    tradier_client = TradierClient("account_id", "access_token", sandbox=True)
+    mocker.patch.object(tradier_client.session, "close")
+
+    async with tradier_client as client:
+        assert client is tradier_client
+        tradier_client.session.close.assert_not_called()
+
+    tradier_client.session.close.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_mixin_order_independent(mocker):
+    class MarketDataFirstClient(
+        MarketDataClient, StreamingClient, TradingClient, AccountClient
+    ):
+        pass
+
+    session = WebUtil("https://sandbox.tradier.com", "access_token")
+    client = MarketDataFirstClient(session, "account_id", "access_token", True)
+
+    async def mock_get(url: str, params: dict = None):
+        return {"order": {"id": 1, "status": "open"}}
+
+    async def mock_delete(url: str):
+        return {"order": {"id": 1, "status": "ok"}}
+
+    mocker.patch.object(session, "get", side_effect=mock_get)
+    mocker.patch.object(session, "delete", side_effect=mock_delete)
+
+    order = await client.get_order(1)
+    assert order.id == 1
+    session.get.assert_called_once_with(
+        "/v1/accounts/account_id/orders/1", params={"includeTags": "true"}
+    )
+
+    await client.cancel_order(1)
+    session.delete.assert_called_once_with("/v1/accounts/account_id/orders/1")
+
+
 @pytest.mark.asyncio
 async def test_get_positions_single(mocker, tradier_client):
     def mock_get(path: str, params: dict = None):
@@ -241,6 +291,19 @@ async def test_cancel_order(mocker, tradier_client):
     )
 
 
+@pytest.mark.asyncio
+async def test_cancel_order_missing_order(mocker, tradier_client):
+    def mock_delete(path: str, params: dict = None):
+        return {"status": "error"}
+
+    mocker.patch.object(tradier_client.session, "delete", side_effect=mock_delete)
+
+    with pytest.raises(TradierAPIError) as excinfo:
+        await tradier_client.cancel_order("123456")
+    assert excinfo.value.key == "order"
+    assert excinfo.value.response == {"status": "error"}
+
+
 @pytest.mark.asyncio
 async def test_get_orders_single(mocker, tradier_client):
     def mock_get(path: str, params: dict = None):
@@ -288,17 +351,9 @@ async def test_get_orders_single(mocker, tradier_client):
     assert orders[0].transaction_date == "2018-06-06T20:16:17.357Z"
     assert orders[0].class_ == "option"
     assert orders[0].option_symbol == "SPY180720C00274000"
-    tradier_client.session.get.assert_has_calls(
-        [
-            call(
-                "/v1/accounts/account_id/orders",
-                params={"page": 1, "includeTags": "true"},
-            ),
-            call(
-                "/v1/accounts/account_id/orders",
-                params={"page": 2, "includeTags": "true"},
-            ),
-        ]
+    tradier_client.session.get.assert_called_once_with(
+        "/v1/accounts/account_id/orders",
+        params={"page": 1, "limit": 25, "includeTags": "true"},
     )
 
 
@@ -353,20 +408,43 @@ async def test_get_orders_multiple(mocker, tradier_client):
     mocker.patch.object(tradier_client.session, "get", side_effect=mock_get)
     orders = await tradier_client.get_orders()
     assert len(orders) == 2
-    tradier_client.session.get.assert_has_calls(
-        [
-            call(
-                "/v1/accounts/account_id/orders",
-                params={"page": 1, "includeTags": "true"},
-            ),
-            call(
-                "/v1/accounts/account_id/orders",
-                params={"page": 2, "includeTags": "true"},
-            ),
-        ]
+    tradier_client.session.get.assert_called_once_with(
+        "/v1/accounts/account_id/orders",
+        params={"page": 1, "limit": 25, "includeTags": "true"},
     )
 
 
+@pytest.mark.asyncio
+async def test_get_orders_many_pages(mocker, tradier_client):
+    def mock_get(path: str, params: dict = None):
+        if params.get("page") > 10:
+            return {"orders": "null"}
+        return {
+            "orders": {
+                "order": [
+                    {
+                        "id": params.get("page") * 100 + i,
+                        "type": "market",
+                        "symbol": "SPY",
+                        "side": "buy",
+                        "quantity": 1.00000000,
+                        "status": "filled",
+                        "duration": "day",
+                        "class": "equity",
+                    }
+                    for i in range(params.get("limit"))
+                ],
+            }
+        }
+
+    mocker.patch.object(tradier_client.session, "get", side_effect=mock_get)
+    orders = await tradier_client.get_orders()
+    assert [order.id for order in orders] == [
+        page * 100 + i for page in range(1, 11) for i in range(25)
+    ]
+    assert tradier_client.session.get.call_count == 13
+
+
 @pytest.mark.asyncio
 async def test_modify_order(mocker, tradier_client):
     def mock_put(path: str, data: dict = None):
@@ -650,6 +728,77 @@ async def test_get_quotes_unmatched_symbol(mocker, tradier_client):
     )
 
 
+@pytest.mark.asyncio
+async def test_get_quotes_batched(mocker, tradier_client):
+    def mock_get(path: str, params: dict = None):
+        symbols = params["symbols"].split(",")
+        return {
+            "quotes": {
+                "quote": [{"symbol": s, "type": "stock"} for s in symbols[1:]],
+                "unmatched_symbols": {"symbol": symbols[0]},
+            }
+        }
+
+    symbols = [f"S{i}" for i in range(250)]
+    mocker.patch.object(tradier_client.session, "get", side_effect=mock_get)
+    quotes = await tradier_client.get_quotes(symbols)
+
+    assert len(quotes) == 250
+    assert [q.symbol for q in quotes[:247]] == [
+        s for s in symbols if s not in ("S0", "S100", "S200")
+    ]
+    assert [q.symbol for q in quotes[247:]] == ["S0", "S100", "S200"]
+    assert all(q.note == "unmatched symbol" for q in quotes[247:])
+
+    tradier_client.session.get.assert_has_calls(
+        [
+            call(
+                "/v1/markets/quotes",
+                params={"symbols": ",".join(symbols[0:100]), "greeks": "false"},
+            ),
+            call(
+                "/v1/markets/quotes",
+                params={"symbols": ",".join(symbols[100:200]), "greeks": "false"},
+            ),
+            call(
+                "/v1/markets/quotes",
+                params={"symbols": ",".join(symbols[200:250]), "greeks": "false"},
+            ),
+        ]
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_quotes_many(mocker, tradier_client):
+    def mock_get(path: str, params: dict = None):
+        return {
+            "quotes": {
+                "quote": [
+                    {"symbol": "AAPL", "type": "stock", "last": 185.75},
+                    {"symbol": "SPY", "type": "etf", "last": 470.1},
+                ],
+                "unmatched_symbols": {"symbol": "SEFDF"},
+            }
+        }
+
+    mocker.patch.object(tradier_client.session, "get", side_effect=mock_get)
+    symbols = ("AAPL", "SPY", "SEFDF")
+    quotes = await tradier_client.get_quotes_many(symbols)
+    await tradier_client.get_quotes_many(symbols)
+
+    assert list(quotes) == ["AAPL", "SPY", "SEFDF"]
+    assert quotes["AAPL"].last == 185.75
+    assert quotes["SPY"].last == 470.1
+    assert quotes["SEFDF"].note == "unmatched symbol"
+
+    first, second = tradier_client.session.get.call_args_list
+    assert first == call(
+        "/v1/markets/quotes",
+        params={"symbols": "AAPL,SPY,SEFDF", "greeks": "false"},
+    )
+    assert first.kwargs["params"] is second.kwargs["params"]
+
+
 @pytest.mark.asyncio
 async def test_get_quotes_parts_unmatch_symbol(mocker, tradier_client):
     def mock_get(path: str, params: dict = None):
@@ -2286,6 +2435,15 @@ async def test_get_calendar_invalid_param(mocker, tradier_client):
     except InvalidParameter:
         assert True
 
+    with pytest.raises(InvalidParameter):
+        await tradier_client.get_calendar("20a4", "01")
+
+    with pytest.raises(InvalidParameter):
+        await tradier_client.get_calendar("2024", "ab")
+
+    with pytest.raises(InvalidParameter):
+        await tradier_client.get_calendar("2024", "00")
+
 
 @pytest.mark.asyncio()
 async def test_buy_stock_market_order(mocker, tradier_client):
@@ -2587,6 +2745,193 @@ async def test_get_streaming_account_session(mocker, tradier_client):
     tradier_client.session.post.assert_called_once_with("/v1/accounts/events/session")
 
 
+@pytest.mark.asyncio()
+async def test_stream_order_with_detail(mocker, tradier_client):
+    frames = [
+        '{"event": "heartbeat"}',
+        '{"event": "order", "id": 1}',
+        '{"event": "order", "id": 2}',
+    ]
+
+    class FakeWebsocket:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        async def send(self, payload):
+            pass
+
+        async def recv(self):
+            if frames:
+                return frames.pop(0)
+            raise ConnectionError("stream closed")
+
+    async def mock_post(path: str, data: dict = None):
+        return {
+            "stream": {
+                "url": "wss://ws.tradier.com/v1/accounts/events",
+                "sessionid": "c8638963-a6d4-4fb9-9bc6-e25fbd8c60c3",
+            }
+        }
+
+    async def mock_get(url: str, params: dict = None):
+        order_id = int(url.rsplit("/", 1)[1])
+        # the first order resolves last; results must still come out in order
+        await asyncio.sleep(0.02 if order_id == 1 else 0)
+        return {"order": {"id": order_id, "status": "filled"}}
+
+    mocker.patch.object(tradier_client.session, "post", side_effect=mock_post)
+    mocker.patch.object(tradier_client.session, "get", side_effect=mock_get)
+    mocker.patch(
+        "asynctradier.clients.streaming_client.websockets.connect",
+        return_value=FakeWebsocket(),
+    )
+
+    orders = []
+    with pytest.raises(ConnectionError):
+        async for order in tradier_client.stream_order():
+            orders.append(order)
+
+    assert [order.id for order in orders] == [1, 2]
+    assert tradier_client.session.get.call_count == 2
+    assert tradier_client._account_stream_session is None
+
+
+@pytest.mark.asyncio()
+async def test_stream_order_detail_error_keeps_session(mocker, tradier_client):
+    frames = ['{"event": "order", "id": 1}']
+
+    class FakeWebsocket:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        async def send(self, payload):
+            pass
+
+        async def recv(self):
+            if frames:
+                return frames.pop(0)
+            await asyncio.sleep(1)
+
+    async def mock_post(path: str, data: dict = None):
+        return {
+            "stream": {
+                "url": "wss://ws.tradier.com/v1/accounts/events",
+                "sessionid": "c8638963-a6d4-4fb9-9bc6-e25fbd8c60c3",
+            }
+        }
+
+    async def mock_get(url: str, params: dict = None):
+        raise BadRequestException(400, "order not found")
+
+    mocker.patch.object(tradier_client.session, "post", side_effect=mock_post)
+    mocker.patch.object(tradier_client.session, "get", side_effect=mock_get)
+    mocker.patch(
+        "asynctradier.clients.streaming_client.websockets.connect",
+        return_value=FakeWebsocket(),
+    )
+
+    with pytest.raises(BadRequestException):
+        async for _ in tradier_client.stream_order():
+            pass
+
+    assert tradier_client._account_stream_session is not None
+
+
+@pytest.mark.asyncio()
+async def test_stream_order_detail_workers(mocker, tradier_client):
+    frames = ['{"event": "order", "id": %d}' % order_id for order_id in range(1, 7)]
+
+    class FakeWebsocket:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        async def send(self, payload):
+            pass
+
+        async def recv(self):
+            if frames:
+                return frames.pop(0)
+            await asyncio.sleep(3600)
+
+    async def mock_post(path: str, data: dict = None):
+        return {"stream": {"url": "wss://ws.tradier.com", "sessionid": "id"}}
+
+    in_flight = 0
+    most_in_flight = 0
+
+    async def mock_get(url: str, params: dict = None):
+        nonlocal in_flight, most_in_flight
+        in_flight += 1
+        most_in_flight = max(most_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        order_id = int(url.rsplit("/", 1)[1])
+        if order_id > 1:
+            raise ConnectionError("order detail failed")
+        return {"order": {"id": order_id, "status": "filled"}}
+
+    unhandled = []
+    loop = asyncio.get_running_loop()
+    loop.set_exception_handler(lambda loop, context: unhandled.append(context))
+
+    mocker.patch("asynctradier.clients.streaming_client.ORDER_DETAIL_WORKERS", 2)
+    mocker.patch.object(tradier_client.session, "post", side_effect=mock_post)
+    mocker.patch.object(tradier_client.session, "get", side_effect=mock_get)
+    mocker.patch(
+        "asynctradier.clients.streaming_client.websockets.connect",
+        return_value=FakeWebsocket(),
+    )
+
+    stream = tradier_client.stream_order()
+    order = await stream.__anext__()
+    assert order.id == 1
+
+    # let the remaining detail requests fail before the stream is closed
+    await asyncio.sleep(0.1)
+    await stream.aclose()
+    gc.collect()
+    await asyncio.sleep(0)
+
+    assert most_in_flight == 2
+    assert tradier_client.session.get.call_count == 6
+    assert unhandled == []
+    loop.set_exception_handler(None)
+
+
+@pytest.mark.asyncio()
+async def test_streaming_session_reused(mocker, tradier_client):
+    def mock_post(path: str, data: dict = None):
+        return {
+            "stream": {
+                "url": "wss://ws.tradier.com/v1/accounts/events",
+                "sessionid": "c8638963-a6d4-4fb9-9bc6-e25fbd8c60c3",
+            }
+        }
+
+    mocker.patch.object(tradier_client.session, "post", side_effect=mock_post)
+
+    first = await tradier_client._get_streaming_account_session()
+    second = await tradier_client._get_streaming_account_session()
+    assert first is second
+    tradier_client.session.post.assert_called_once_with("/v1/accounts/events/session")
+
+    mocker.patch(
+        "asynctradier.clients.streaming_client.time.monotonic",
+        return_value=tradier_client._account_stream_session[1] + 300,
+    )
+    await tradier_client._get_streaming_account_session()
+    assert tradier_client.session.post.call_count == 2
+
+
 @pytest.mark.asyncio()
 async def test_get_historical_quotes(mocker, tradier_client):
     def mock_get(url: str, params: dict = None):
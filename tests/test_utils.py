@@ -1,9 +1,32 @@
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from asynctradier.common import MarketDataType, TradeType
+from asynctradier.exceptions import (
+    BadRequestException,
+    InvalidOptionType,
+    TradierAPIError,
+)
 from asynctradier.utils.common import (
+    MemberLookup,
+    as_list,
     build_option_symbol,
+    dig,
     is_valid_datetime,
     is_valid_expiration_date,
     is_valid_option_type,
+    json_dumps,
+    json_loads,
+    to_float,
+    to_int,
+    unwrap,
 )
+from asynctradier.utils.webutils import WebUtil
 
 
 def test_build_option_symbol():
@@ -16,6 +39,17 @@ def test_build_option_symbol():
     assert symbol == "SPY210115C00300000"
 
 
+def test_build_option_symbol_cached():
+    build_option_symbol.cache_clear()
+    for _ in range(3):
+        symbol = build_option_symbol("QQQ", "2024-03-15", 410, "put")
+    assert symbol == "QQQ240315P00410000"
+    assert build_option_symbol.cache_info().hits == 2
+
+    with pytest.raises(InvalidOptionType):
+        build_option_symbol("QQQ", "2024-03-15", 410, "straddle")
+
+
 def test_is_valid_expiration_date():
     d = "2021-01-15"
     assert is_valid_expiration_date(d) is True
@@ -27,6 +61,14 @@ def test_is_valid_expiration_date():
     assert is_valid_expiration_date(d) is False
     d = "2021-01-05"
     assert is_valid_expiration_date(d) is True
+    d = "2021-13-05"
+    assert is_valid_expiration_date(d) is False
+    d = "2021-00-05"
+    assert is_valid_expiration_date(d) is False
+    d = "2021-01-32"
+    assert is_valid_expiration_date(d) is False
+    d = "2021-01-050"
+    assert is_valid_expiration_date(d) is False
 
 
 def test_is_valid_option_type():
@@ -49,3 +91,160 @@ def test_is_valid_datetime():
     assert is_valid_datetime(d) is True
     d = "2021-01-15T12:00"
     assert is_valid_datetime(d) is False
+    d = "2021-01-15 24:00"
+    assert is_valid_datetime(d) is False
+    d = "2021-01-15 23:60"
+    assert is_valid_datetime(d) is False
+
+
+def test_as_list():
+    assert as_list([1, 2]) == [1, 2]
+    assert as_list([]) == []
+    assert as_list({"a": 1}) == [{"a": 1}]
+    assert as_list("SPY") == ["SPY"]
+    assert as_list(None) == []
+    assert as_list("null") == []
+
+
+def test_dig():
+    response = {"quotes": {"quote": [{"symbol": "SPY"}]}, "orders": "null"}
+    assert dig(response, "quotes", "quote", 0, "symbol") == "SPY"
+    assert dig(response, "quotes", "unmatched_symbols", "symbol") is None
+    assert dig(response, "quotes", "quote", 1, default=[]) == []
+    assert dig(response, "orders", "order") is None
+    assert dig(None, "history", "day", default=[]) == []
+    assert dig(response) is response
+
+
+def test_to_float_and_to_int():
+    value = 1.5
+    assert to_float(value) is value
+    assert to_float(100) == 100.0 and type(to_float(100)) is float
+    assert to_float("2.25") == 2.25
+    assert to_float(None) == 0.0
+    assert to_float("") == 0.0
+
+    assert to_int(3) == 3
+    assert to_int("4") == 4
+    assert to_int(None) == 0
+
+
+def test_member_lookup():
+    lookup = MemberLookup(TradeType, aliases={"Equity": TradeType.equity})
+    assert lookup["equity"] is TradeType.equity
+    assert lookup["Equity"] is TradeType.equity
+    assert lookup[None] is None
+    assert lookup[""] is None
+
+    with pytest.raises(ValueError):
+        lookup["EQUITY"]
+
+    normalized = MemberLookup(TradeType, normalize=str.lower)
+    assert normalized["OPTION"] is TradeType.option
+
+    required = MemberLookup(MarketDataType, required=True)
+    assert required["quote"] is MarketDataType.quote
+    with pytest.raises(ValueError):
+        required[None]
+
+
+def test_unwrap():
+    order = {"id": 1, "status": "ok"}
+    assert unwrap({"order": order}, "order") is order
+
+    with pytest.raises(TradierAPIError):
+        unwrap({"errors": {"error": "Invalid order"}}, "order")
+
+    with pytest.raises(TradierAPIError):
+        unwrap("null", "order")
+
+
+def test_json_roundtrip():
+    payload = {"filter": [MarketDataType.trade], "linebreak": True, "symbols": []}
+    encoded = json_dumps(payload)
+    assert isinstance(encoded, str)
+    assert json_loads(encoded) == {
+        "filter": ["trade"],
+        "linebreak": True,
+        "symbols": [],
+    }
+
+
+@pytest.mark.asyncio
+async def test_webutil_reuses_session():
+    async with WebUtil("https://sandbox.tradier.com", "token") as web_util:
+        session = web_util._get_session()
+        assert web_util._get_session() is session
+        assert session.headers["Authorization"] == "Bearer token"
+        assert session.headers["Accept"] == "application/json"
+        assert session.timeout.total == 30
+        assert session.timeout.connect == 5
+
+    assert session.closed
+    assert web_util._session is None
+
+
+@pytest.mark.asyncio
+async def test_webutil_make_request():
+    async def quotes(request):
+        assert request.headers["Authorization"] == "Bearer token"
+        return web.json_response(
+            {"quotes": {"quote": {"symbol": request.query["symbols"]}}}
+        )
+
+    async def errors(request):
+        return web.json_response({"errors": {"error": "Invalid Parameter"}})
+
+    async def failure(request):
+        return web.Response(status=401, text="Invalid Access Token")
+
+    app = web.Application()
+    app.router.add_get("/v1/markets/quotes", quotes)
+    app.router.add_get("/v1/errors", errors)
+    app.router.add_get("/v1/failure", failure)
+
+    async with TestServer(app) as server:
+        async with WebUtil(str(server.make_url("/")), "token") as web_util:
+            response = await web_util.get("/v1/markets/quotes", {"symbols": "SPY"})
+            assert response == {"quotes": {"quote": {"symbol": "SPY"}}}
+
+            with pytest.raises(BadRequestException):
+                await web_util.get("/v1/errors")
+
+            with pytest.raises(BadRequestException):
+                await web_util.get("/v1/failure")
+
+
+def test_webutil_across_event_loops():
+    class QuoteHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = b'{"quotes": {"quote": {"symbol": "SPY"}}}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), QuoteHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        web_util = WebUtil(f"http://127.0.0.1:{server.server_port}", "token")
+
+        async def get_quotes():
+            return web_util._get_session(), await web_util.get("/v1/markets/quotes")
+
+        first_session, first = asyncio.run(get_quotes())
+        second_session, second = asyncio.run(get_quotes())
+
+        assert first == second == {"quotes": {"quote": {"symbol": "SPY"}}}
+        assert second_session is not first_session
+        assert first_session.closed
+
+        asyncio.run(web_util.close())
+        assert web_util._session is None
+    finally:
+        server.shutdown()
+        server.server_close()